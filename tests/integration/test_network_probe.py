@@ -0,0 +1,101 @@
+"""
+Tests for NetworkConnectivityTester.probe.
+
+The individual checks are patched out so these tests never touch the network.
+"""
+from unittest.mock import patch
+
+from tests.integration.test_utils import NetworkConnectivityTester
+
+
+async def _resolves(hostname):
+    return True
+
+
+async def _connects(host, port, timeout=5.0):
+    return True
+
+
+async def _valid_cert(host, port=443):
+    return {'valid': True}
+
+
+async def _reachable(base_url, timeout=10.0):
+    return {'connectivity': True, 'response_time': 0.01, 'status_code': 200, 'error': None}
+
+
+def _patch_checks(**overrides):
+    checks = {
+        'test_dns_resolution': _resolves,
+        'test_tcp_connection': _connects,
+        'test_ssl_certificate': _valid_cert,
+        'test_http_connectivity': _reachable,
+    }
+    checks.update(overrides)
+    return [patch.object(NetworkConnectivityTester, name, staticmethod(check))
+            for name, check in checks.items()]
+
+
+class TestNetworkConnectivityProbe:
+    """Test NetworkConnectivityTester.probe with patched checks."""
+
+    async def _probe(self, **overrides):
+        patches = _patch_checks(**overrides)
+        for p in patches:
+            p.start()
+        try:
+            return await NetworkConnectivityTester.probe("example.com")
+        finally:
+            for p in patches:
+                p.stop()
+
+    async def test_probe_collects_every_check(self):
+        """Test that a healthy probe returns each check's result."""
+        result = await self._probe()
+
+        assert result == {
+            'dns': True,
+            'tcp': True,
+            'ssl': {'valid': True},
+            'http': {'connectivity': True, 'response_time': 0.01, 'status_code': 200, 'error': None},
+        }
+
+    async def test_raising_check_is_reported_not_grouped(self):
+        """Test that a check raising outside its own handler becomes a failed result."""
+        async def bad_hostname(hostname):
+            # gethostbyname raises UnicodeError for over-long labels, not gaierror
+            raise UnicodeError("label too long")
+
+        async def missing_client(base_url, timeout=10.0):
+            raise ImportError("No module named 'aiohttp'")
+
+        result = await self._probe(
+            test_dns_resolution=bad_hostname,
+            test_http_connectivity=missing_client,
+        )
+
+        assert result['dns'] is False
+        assert result['tcp'] is True
+        assert result['ssl'] == {'valid': True}
+        assert result['http'] == {
+            'connectivity': False,
+            'response_time': None,
+            'status_code': None,
+            'error': "No module named 'aiohttp'",
+        }
+
+    async def test_failing_check_does_not_cancel_siblings(self):
+        """Test that the remaining checks still complete when one fails."""
+        completed = []
+
+        async def refused(host, port, timeout=5.0):
+            raise ConnectionRefusedError("refused")
+
+        async def recording_cert(host, port=443):
+            completed.append('ssl')
+            return {'valid': True}
+
+        result = await self._probe(test_tcp_connection=refused, test_ssl_certificate=recording_cert)
+
+        assert result['tcp'] is False
+        assert completed == ['ssl']
@@ -15,11 +15,13 @@ import socket
 import ssl
 import time
 import tempfile
+from array import array
 from contextlib import asynccontextmanager, contextmanager
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Awaitable, Callable, FrozenSet, Iterable, Optional, List, Mapping, Union
 from unittest.mock import Mock, patch
 import pytest
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 from src.core.api.robinhood.client import RobinhoodClient, RobinhoodAPIConfig
 from src.core.api.robinhood.auth import RobinhoodSignatureAuth
@@ -88,26 +90,28 @@ class APIResponseValidator:
     """Validates API responses for integration tests."""
 
     @staticmethod
-    def validate_json_response(response: Any, expected_keys: Optional[List[str]] = None) -> Dict[str, Any]:
+    def validate_json_response(response: Any, expected_keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """Validate JSON response structure."""
         if not isinstance(response, dict):
             raise AssertionError(f"Expected dict response, got {type(response)}")
 
         if expected_keys:
-            missing_keys = [key for key in expected_keys if key not in response]
+            if not isinstance(expected_keys, (set, frozenset)):
+                expected_keys = set(expected_keys)
+            missing_keys = expected_keys - response.keys()
             if missing_keys:
-                raise AssertionError(f"Missing expected keys: {missing_keys}")
+                raise AssertionError(f"Missing expected keys: {sorted(missing_keys)}")
 
         return response
 
     @staticmethod
-    def validate_http_status_code(status_code: int, expected_codes: Union[int, List[int]]) -> None:
+    def validate_http_status_code(status_code: int, expected_codes: Union[int, List[int], FrozenSet[int]]) -> None:
         """Validate HTTP status code."""
         if isinstance(expected_codes, int):
-            expected_codes = [expected_codes]
-
-        if status_code not in expected_codes:
-            raise AssertionError(f"Expected status code {expected_codes}, got {status_code}")
+            if status_code != expected_codes:
+                raise AssertionError(f"Expected status code {[expected_codes]}, got {status_code}")
+        elif status_code not in expected_codes:
+            raise AssertionError(f"Expected status code {sorted(expected_codes)}, got {status_code}")
 
     @staticmethod
     def validate_response_time(response_time: float, max_time: float = 5.0) -> None:
@@ -229,6 +233,46 @@ class NetworkConnectivityTester:
 
         return results
 
+    @staticmethod
+    async def _run_check(check: Awaitable[Any], on_error: Callable[[Exception], Any]) -> Any:
+        """Await a single check, mapping any exception to its failure result."""
+        try:
+            return await check
+        except Exception as e:
+            return on_error(e)
+
+    @classmethod
+    async def probe(cls, host: str, port: int = 443, base_url: Optional[str] = None) -> Dict[str, Any]:
+        """Run the DNS, TCP, SSL and HTTP checks against a host concurrently.
+
+        Each check is guarded inside the task group, so a failing check is
+        reported as a failed result instead of cancelling its siblings and
+        surfacing as an ``ExceptionGroup``.
+        """
+        async with asyncio.TaskGroup() as tg:
+            dns_task = tg.create_task(cls._run_check(
+                cls.test_dns_resolution(host), lambda e: False
+            ))
+            tcp_task = tg.create_task(cls._run_check(
+                cls.test_tcp_connection(host, port), lambda e: False
+            ))
+            ssl_task = tg.create_task(cls._run_check(
+                cls.test_ssl_certificate(host, port),
+                lambda e: {'valid': False, 'error': str(e)}
+            ))
+            http_task = tg.create_task(cls._run_check(
+                cls.test_http_connectivity(base_url or f"https://{host}"),
+                lambda e: {'connectivity': False, 'response_time': None,
+                           'status_code': None, 'error': str(e)}
+            ))
+
+        return {
+            'dns': dns_task.result(),
+            'tcp': tcp_task.result(),
+            'ssl': ssl_task.result(),
+            'http': http_task.result()
+        }
+
 
 class PerformanceMonitor:
     """Monitors performance metrics during testing."""
@@ -243,7 +287,9 @@ class PerformanceMonitor:
             'start_time': None,
             'end_time': None
         }
-        self.response_times = []
+        self._metrics_view = MappingProxyType(self.metrics)
+        # Packed float64 buffer: 8 bytes per sample instead of a boxed float per entry
+        self.response_times = array('d')
 
     def start_monitoring(self):
         """Start performance monitoring."""
@@ -255,10 +301,21 @@ class PerformanceMonitor:
         self.metrics['end_time'] = time.time()
 
         if self.response_times:
-            self.metrics['min_response_time'] = min(self.response_times)
-            self.metrics['max_response_time'] = max(self.response_times)
-            self.metrics['avg_response_time'] = sum(self.response_times) / len(self.response_times)
-            self.metrics['total_response_time'] = sum(self.response_times)
+            # Single pass over the samples for min, max and total
+            total = 0.0
+            lo = float('inf')
+            hi = 0.0
+            for t in self.response_times:
+                total += t
+                if t < lo:
+                    lo = t
+                if t > hi:
+                    hi = t
+
+            self.metrics['min_response_time'] = lo
+            self.metrics['max_response_time'] = hi
+            self.metrics['avg_response_time'] = total / len(self.response_times)
+            self.metrics['total_response_time'] = total
 
         logger.info(f"Performance monitoring ended. Total requests: {self.metrics['request_count']}")
 
@@ -270,9 +327,15 @@ class PerformanceMonitor:
         if not success:
             self.metrics['error_count'] += 1
 
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get performance metrics."""
-        return self.metrics.copy()
+    def get_metrics(self, copy: bool = True) -> Mapping[str, Any]:
+        """Get performance metrics.
+
+        Returns a snapshot by default; pass ``copy=False`` for a live
+        read-only view that keeps tracking later requests.
+        """
+        if copy:
+            return self.metrics.copy()
+        return self._metrics_view
 
     def get_summary(self) -> str:
         """Get performance summary."""
@@ -1,15 +1,20 @@
 """
 Mock infrastructure for external dependencies.
 """
-from .api_mocks import RobinhoodApiMock, MockApiResponse
-from .redis_mock import RedisMock
+from .api_mocks import RobinhoodApiMock, MockApiResponse, MockNotFound, MockNotAuthenticated, QuoteNotFound, MockQuote
+from .redis_mock import RedisMock, RedisMockSync
 from .websocket_mock import WebSocketMock, MockWebSocketMessage
 from .trading_mock import TradingEngineMock, RiskManagerMock
 
 __all__ = [
     'RobinhoodApiMock',
     'MockApiResponse',
+    'MockNotFound',
+    'MockNotAuthenticated',
+    'QuoteNotFound',
+    'MockQuote',
     'RedisMock',
+    'RedisMockSync',
     'WebSocketMock',
     'MockWebSocketMessage',
     'TradingEngineMock',
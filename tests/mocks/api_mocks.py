@@ -2,36 +2,172 @@
 Mock implementations for external API dependencies.
 """
 import asyncio
+import itertools
 import json
+import math
+import random
+import re
+import sys
 import time
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Iterable, Iterator, Mapping, Optional, Tuple, Union
 from unittest.mock import AsyncMock, Mock
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from types import MappingProxyType
 
 
-@dataclass
+# Shared read-only default; replace a response's headers rather than mutating them
+_DEFAULT_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+
+class MockNotFound(Exception):
+    """Raised by the API mocks when a requested resource does not exist."""
+    __slots__ = ()
+
+
+class QuoteNotFound(MockNotFound):
+    """Raised by the API mocks when no quote exists for a symbol."""
+    __slots__ = ()
+
+
+class MockNotAuthenticated(Exception):
+    """Raised by the API mocks for calls that need authentication."""
+    __slots__ = ()
+
+
+@lru_cache(maxsize=1024)
+def _missing_crypto_quote(symbol: str) -> MappingProxyType:
+    """Read-only error entry for a crypto symbol without a quote."""
+    return MappingProxyType({"symbol": symbol, "error": f"Quote not found for {symbol}"})
+
+
+@lru_cache(maxsize=8)
+def _large_payload(size: int) -> str:
+    """Filler string for simulated large responses, shared per size."""
+    return "x" * size
+
+
+# Field layout and defaults for orders created by place_order
+_ORDER_TEMPLATE = {
+    "id": None,
+    "symbol": None,
+    "quantity": None,
+    "side": None,
+    "type": "limit",
+    "price": None,
+    "status": "placed",
+    "created_at": None
+}
+
+# Issued token lifetime; the expiry is reused until it is within an hour of lapsing
+_TOKEN_LIFETIME = timedelta(hours=24)
+_TOKEN_REISSUE_AFTER = (_TOKEN_LIFETIME - timedelta(hours=1)).total_seconds()
+
+# Message for every unauthenticated call
+_NOT_AUTHENTICATED = "Not authenticated"
+
+
+def _guard(delay: float, *, auth: bool = False, error_msg: Optional[str] = None):
+    """Shared prologue for mock API methods.
+
+    Rejects unauthenticated calls when ``auth`` is set, counts the request and
+    applies the simulated ``delay``, then injects ``error_msg`` in error mode.
+    """
+    def decorator(method):
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if auth and not self.authenticated:
+                raise MockNotAuthenticated(_NOT_AUTHENTICATED)
+            if (wait := self._tick(delay)) > 0:
+                await self._wait_delay_bucket(wait)
+            if error_msg is not None:
+                self._maybe_error(error_msg)
+            return await method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@lru_cache(maxsize=1024)
+def _format_message(template: str, args: Tuple[Any, ...]) -> str:
+    """Memoized error message for a template and its arguments."""
+    return template.format(*args) if args else template
+
+
+def _not_found(template: str, key: str, exc_type: type = MockNotFound) -> MockNotFound:
+    """Fresh not-found exception for a message template and key."""
+    return exc_type(_format_message(template, (key,)))
+
+
+def _last_price(quotes: Mapping[str, Mapping[str, Any]], symbol: str, default: str = "0") -> str:
+    """Last trade price for a symbol, or the default when it has no quote."""
+    quote = quotes.get(symbol)
+    return quote["last_trade_price"] if quote else default
+
+
+@lru_cache(maxsize=1024)
+def _missing_quote(symbol: str) -> MappingProxyType:
+    """Read-only error entry for a symbol without a quote."""
+    return MappingProxyType({"error": f"Quote not found for {symbol}"})
+
+
+@dataclass(slots=True, frozen=True)
 class MockApiResponse:
     """Represents a mock API response."""
     data: Any
     status_code: int = 200
-    headers: Dict[str, str] = None
+    # Factory hands back the shared mapping; dataclasses rejects unhashable plain defaults
+    headers: Mapping[str, str] = field(default_factory=lambda: _DEFAULT_HEADERS)
     delay: float = 0.0  # Simulate network delay
 
-    def __post_init__(self):
-        if self.headers is None:
-            self.headers = {"Content-Type": "application/json"}
+
+@dataclass(slots=True, frozen=True)
+class MockQuote:
+    """Typed, immutable snapshot of a mock equity quote."""
+    symbol: str
+    ask_price: str
+    bid_price: str
+    last_trade_price: str
+    volume: str
+    high_24h: str
+    low_24h: str
+
+
+class _RequestCounter:
+    """Mutable request tally; a slot write is cheaper than rebinding an instance attribute."""
+    __slots__ = ("n",)
+
+    def __init__(self):
+        self.n = 0
 
 
 class RobinhoodApiMock:
     """Comprehensive mock for Robinhood API client."""
 
+    # Simulated network delays are skipped unless explicitly enabled
+    delay_enabled: bool = False
+    # Getters hand out plain dict copies; set True to get read-only views
+    # over the stored records instead (not JSON-serializable)
+    RETURN_FROZEN: bool = False
+
+    # Fixed delay used in place of each call's own delay when set
+    _delay_override: Optional[float] = None
+
+    # Last (epoch second, formatted date and time) pair used by _now_iso
+    _iso_cache: Tuple[int, str] = (-1, "")
+
     def __init__(self):
         self.authenticated = False
         self.auth_token = "mock_auth_token"
-        self.request_count = 0
+        self._requests = _RequestCounter()
         self.error_mode = False
         self.error_rate = 0.0  # 0-1.0
+        self._rng = random.Random()
+        self._token_expiry: Optional[datetime] = None
+        self._token_refresh_at = 0.0  # time.monotonic() deadline for reissuing _token_expiry
+        self._order_seq = itertools.count(1)
+        self._crypto_order_seq = itertools.count(1)
+        self._pending_delays: Dict[float, asyncio.Event] = {}
 
         # Storage for mock data
         self._accounts = {}
@@ -41,9 +177,29 @@ class RobinhoodApiMock:
         self._positions = {}
         self._market_data = {}
 
+        # Secondary order indexes (dicts used as insertion-ordered sets of ids)
+        self._orders_by_status: Dict[str, Dict[str, None]] = {}
+        self._crypto_orders_by_symbol: Dict[str, Dict[str, None]] = {}
+
         self._setup_default_data()
         self._setup_crypto_data()
 
+    def _serve(self, record: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Return a copy of a stored record, or a read-only view when RETURN_FROZEN is set."""
+        if not self.RETURN_FROZEN:
+            return dict(record)
+        return record if type(record) is MappingProxyType else MappingProxyType(record)
+
+    def _serve_all(self, records: Iterable[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
+        """Serve each stored record under the same policy as _serve."""
+        serve = self._serve
+        return [serve(record) for record in records]
+
+    @staticmethod
+    def _freeze(store: Dict[str, Dict[str, Any]]) -> Dict[str, MappingProxyType]:
+        """Build read-only views over every entry of a data store."""
+        return {key: MappingProxyType(value) for key, value in store.items()}
+
     def _setup_default_data(self):
         """Setup default mock data."""
         # Default account
@@ -111,6 +267,12 @@ class RobinhoodApiMock:
             }
         }
 
+        self._accounts_frozen = self._freeze(self._accounts)
+        self._quote_records: Dict[str, MockQuote] = {}
+        self._positions_frozen = self._freeze(self._positions)
+        # Numeric twin of each position's "quantity" string, kept in sync on mutation
+        self._position_qty = {symbol: float(p["quantity"]) for symbol, p in self._positions.items()}
+
         # Crypto-specific data
         self._crypto_accounts = {}
         self._crypto_positions = {}
@@ -176,160 +338,154 @@ class RobinhoodApiMock:
         # Default crypto orders
         self._crypto_orders = {}
 
+        self._crypto_accounts_frozen = self._freeze(self._crypto_accounts)
+        self._crypto_positions_frozen = self._freeze(self._crypto_positions)
+        # (quantity, current_price) floats for each crypto position
+        self._crypto_position_numeric = {
+            code: (float(p["quantity"]), float(p["current_price"]))
+            for code, p in self._crypto_positions.items()
+        }
+
+    @_guard(0.1, error_msg="Authentication failed")
     async def authenticate(self, username: str, password: str) -> Dict[str, Any]:
         """Mock authentication."""
-        await self._simulate_delay(0.1)
-
-        if self.error_mode and self._should_error():
-            raise Exception("Authentication failed")
-
         self.authenticated = True
+        if time.monotonic() >= self._token_refresh_at:
+            self._token_expiry = datetime.now() + _TOKEN_LIFETIME
+            self._token_refresh_at = time.monotonic() + _TOKEN_REISSUE_AFTER
         return {
             "token": self.auth_token,
-            "expires_at": datetime.now() + timedelta(hours=24)
+            "expires_at": self._token_expiry
         }
 
-    async def get_account_info(self) -> Dict[str, Any]:
+    @_guard(0.05, auth=True, error_msg="Failed to get account info")
+    async def get_account_info(self) -> Mapping[str, Any]:
         """Mock get account information."""
-        await self._simulate_delay(0.05)
-
-        if not self.authenticated:
-            raise Exception("Not authenticated")
+        return self._serve(self._accounts_frozen["default"])
 
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to get account info")
-
-        return self._accounts["default"].copy()
-
-    async def get_instruments(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+    @_guard(0.03, error_msg="Failed to get instruments")
+    async def get_instruments(self, symbol: Optional[str] = None) -> List[Mapping[str, Any]]:
         """Mock get instruments."""
-        await self._simulate_delay(0.03)
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to get instruments")
-
-        instruments = list(self._instruments.values())
         if symbol:
-            instruments = [i for i in instruments if i["symbol"] == symbol]
+            instrument = self._instruments.get(symbol)
+            return [self._serve(instrument)] if instrument is not None else []
 
-        return instruments
+        return self._serve_all(self._instruments.values())
 
-    async def get_quote(self, symbol: str) -> Dict[str, Any]:
+    @_guard(0.02)
+    async def get_quote(self, symbol: str) -> Mapping[str, Any]:
         """Mock get quote for a symbol."""
-        await self._simulate_delay(0.02)
-
-        if self.error_mode and self._should_error():
-            raise Exception(f"Failed to get quote for {symbol}")
+        symbol = sys.intern(symbol)
+        # Symbol-specific message, so error injection stays in the body
+        self._maybe_error("Failed to get quote for {}", symbol)
 
         if symbol not in self._quotes:
-            raise Exception(f"Quote not found for {symbol}")
+            raise _not_found("Quote not found for {}", symbol, QuoteNotFound)
 
-        return self._quotes[symbol].copy()
+        return self._serve(self._quotes[symbol])
 
-    async def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
-        """Mock get quotes for multiple symbols."""
-        await self._simulate_delay(0.05)
+    def get_quote_mutable(self, symbol: str) -> Dict[str, Any]:
+        """Get a mutable copy of the stored quote for a symbol."""
+        return dict(self._quotes[symbol])
 
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to get quotes")
-
-        result = {}
-        for symbol in symbols:
-            if symbol in self._quotes:
-                result[symbol] = self._quotes[symbol].copy()
-            else:
-                result[symbol] = {"error": f"Quote not found for {symbol}"}
+    def get_quote_record(self, symbol: str) -> MockQuote:
+        """Get the stored quote for a symbol as a cached MockQuote."""
+        record = self._quote_records.get(symbol)
+        if record is None:
+            record = self._quote_records[symbol] = MockQuote(**self._quotes[symbol])
+        return record
 
-        return result
+    @_guard(0.05, error_msg="Failed to get quotes")
+    async def get_quotes(self, symbols: List[str]) -> Dict[str, Mapping[str, Any]]:
+        """Mock get quotes for multiple symbols."""
+        quotes = self._quotes
+        serve = self._serve
+        try:
+            return {symbol: serve(quotes[symbol]) for symbol in symbols}
+        except KeyError:
+            return {
+                symbol: serve(quote if (quote := quotes.get(symbol)) is not None else _missing_quote(symbol))
+                for symbol in symbols
+            }
 
-    async def place_order(self, **order_data) -> Dict[str, Any]:
+    @_guard(0.1, auth=True, error_msg="Failed to place order")
+    async def place_order(self, **order_data) -> Mapping[str, Any]:
         """Mock place order."""
-        await self._simulate_delay(0.1)
-
-        if not self.authenticated:
-            raise Exception("Not authenticated")
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to place order")
-
-        order_id = f"mock_order_{int(time.time() * 1000)}"
-
-        order = {
-            "id": order_id,
-            "symbol": order_data.get("symbol"),
-            "quantity": order_data.get("quantity"),
-            "side": order_data.get("side"),
-            "type": order_data.get("type", "limit"),
-            "price": order_data.get("price"),
-            "status": "placed",
-            "created_at": datetime.now().isoformat()
-        }
+        order_id = f"mock_order_{next(self._order_seq)}"
+
+        order = dict(_ORDER_TEMPLATE)
+        order["id"] = order_id
+        order["symbol"] = order_data.get("symbol")
+        order["quantity"] = order_data.get("quantity")
+        order["side"] = order_data.get("side")
+        if "type" in order_data:
+            order["type"] = order_data["type"]
+        order["price"] = order_data.get("price")
+        order["created_at"] = self._now_iso()
 
         self._orders[order_id] = order
-        return order
+        self._orders_by_status.setdefault("placed", {})[order_id] = None
+        # Served like every getter; the stored order must stay in step with its index
+        return self._serve(order)
 
+    @_guard(0.05, auth=True, error_msg="Failed to cancel order")
     async def cancel_order(self, order_id: str) -> bool:
         """Mock cancel order."""
-        await self._simulate_delay(0.05)
-
-        if not self.authenticated:
-            raise Exception("Not authenticated")
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to cancel order")
-
         if order_id in self._orders:
-            self._orders[order_id]["status"] = "cancelled"
+            order = self._orders[order_id]
+            # Drop the id from every bucket, not just the one its status names
+            for order_ids in self._orders_by_status.values():
+                order_ids.pop(order_id, None)
+            order["status"] = "cancelled"
+            self._orders_by_status.setdefault("cancelled", {})[order_id] = None
             return True
 
         return False
 
-    async def get_order(self, order_id: str) -> Dict[str, Any]:
+    @_guard(0.03)
+    async def get_order(self, order_id: str) -> Mapping[str, Any]:
         """Mock get order details."""
-        await self._simulate_delay(0.03)
-
         if order_id not in self._orders:
-            raise Exception(f"Order {order_id} not found")
+            raise _not_found("Order {} not found", order_id)
 
-        return self._orders[order_id].copy()
+        return self._serve(self._orders[order_id])
 
-    async def get_orders(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    @_guard(0.04)
+    async def get_orders(self, status: Optional[str] = None) -> List[Mapping[str, Any]]:
         """Mock get orders."""
-        await self._simulate_delay(0.04)
-
-        orders = list(self._orders.values())
         if status:
-            orders = [o for o in orders if o["status"] == status]
+            orders = self._orders
+            return self._serve_all(orders[i] for i in self._orders_by_status.get(status, ()))
 
-        return orders
+        return self._serve_all(self._orders.values())
 
-    async def get_positions(self) -> List[Dict[str, Any]]:
+    @_guard(0.03, error_msg="Failed to get positions")
+    async def get_positions(self) -> List[Mapping[str, Any]]:
         """Mock get positions."""
-        await self._simulate_delay(0.03)
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to get positions")
-
-        return list(self._positions.values())
+        return self._serve_all(self._positions_frozen.values())
 
-    async def get_position(self, symbol: str) -> Dict[str, Any]:
+    @_guard(0.02)
+    async def get_position(self, symbol: str) -> Mapping[str, Any]:
         """Mock get position for a symbol."""
-        await self._simulate_delay(0.02)
+        symbol = sys.intern(symbol)
 
         if symbol not in self._positions:
-            raise Exception(f"Position not found for {symbol}")
+            raise _not_found("Position not found for {}", symbol)
 
-        return self._positions[symbol].copy()
+        return self._serve(self._positions[symbol])
 
+    @_guard(0.1)
     async def close_position(self, symbol: str, quantity: Optional[str] = None) -> Dict[str, Any]:
         """Mock close position."""
-        await self._simulate_delay(0.1)
+        symbol = sys.intern(symbol)
 
         if symbol not in self._positions:
-            raise Exception(f"No position found for {symbol}")
+            raise _not_found("No position found for {}", symbol)
 
         position = self._positions[symbol]
+        held = self._position_qty[symbol]
         close_quantity = quantity or position["quantity"]
+        close_qty = float(quantity) if quantity else held
 
         order = await self.place_order(
             symbol=symbol,
@@ -339,19 +495,26 @@ class RobinhoodApiMock:
         )
 
         # Update position
-        if float(position["quantity"]) <= float(close_quantity):
+        if held <= close_qty:
             del self._positions[symbol]
+            del self._positions_frozen[symbol]
+            del self._position_qty[symbol]
         else:
-            position["quantity"] = str(float(position["quantity"]) - float(close_quantity))
+            remaining = held - close_qty
+            position = dict(position, quantity=str(remaining))
+            self._positions[symbol] = position
+            self._positions_frozen[symbol] = MappingProxyType(position)
+            self._position_qty[symbol] = remaining
 
         return order
 
+    @_guard(0.02)
     async def get_market_data(self, symbol: str) -> Dict[str, Any]:
         """Mock get market data."""
-        await self._simulate_delay(0.02)
+        symbol = sys.intern(symbol)
 
         if symbol not in self._quotes:
-            raise Exception(f"Market data not found for {symbol}")
+            raise _not_found("Market data not found for {}", symbol, QuoteNotFound)
 
         quote = self._quotes[symbol]
         return {
@@ -361,68 +524,58 @@ class RobinhoodApiMock:
             "change_24h": "2.5",
             "high_24h": quote["high_24h"],
             "low_24h": quote["low_24h"],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._now_iso()
         }
 
     # Crypto API Mock Methods
 
-    async def get_crypto_account(self) -> Dict[str, Any]:
+    @_guard(0.03, error_msg="Failed to get crypto account")
+    async def get_crypto_account(self) -> Mapping[str, Any]:
         """Mock get crypto trading account."""
-        await self._simulate_delay(0.03)
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to get crypto account")
-
-        return self._crypto_accounts["default"].copy()
+        return self._serve(self._crypto_accounts_frozen["default"])
 
+    @_guard(0.04, error_msg="Failed to get crypto positions")
     async def get_crypto_positions(self, asset_codes: Optional[List[str]] = None) -> Dict[str, Any]:
         """Mock get crypto positions."""
-        await self._simulate_delay(0.04)
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to get crypto positions")
-
-        positions = list(self._crypto_positions.values())
+        positions = self._crypto_positions_frozen
         if asset_codes:
-            positions = [p for p in positions if p["asset_code"] in asset_codes]
+            # Set membership, but results stay in storage order
+            wanted = set(asset_codes)
+            return {"results": self._serve_all(
+                position for code, position in positions.items() if code in wanted
+            )}
 
-        return {"results": positions}
+        return {"results": self._serve_all(positions.values())}
 
+    @_guard(0.03, error_msg="Failed to get crypto quotes")
     async def get_crypto_quotes(self, symbols: List[str]) -> Dict[str, Any]:
         """Mock get crypto quotes for multiple symbols."""
-        await self._simulate_delay(0.03)
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to get crypto quotes")
-
-        results = []
-        for symbol in symbols:
-            if symbol in self._crypto_quotes:
-                results.append(self._crypto_quotes[symbol].copy())
-            else:
-                results.append({"symbol": symbol, "error": f"Quote not found for {symbol}"})
-
-        return {"results": results}
-
-    async def get_crypto_quote(self, symbol: str) -> Dict[str, Any]:
+        quotes = self._crypto_quotes
+        try:
+            results = [quotes[symbol] for symbol in symbols]
+        except KeyError:
+            results = [
+                quote if (quote := quotes.get(symbol)) is not None else _missing_crypto_quote(symbol)
+                for symbol in symbols
+            ]
+
+        return {"results": self._serve_all(results)}
+
+    @_guard(0.02)
+    async def get_crypto_quote(self, symbol: str) -> Mapping[str, Any]:
         """Mock get crypto quote for single symbol."""
-        await self._simulate_delay(0.02)
-
-        if self.error_mode and self._should_error():
-            raise Exception(f"Failed to get crypto quote for {symbol}")
+        symbol = sys.intern(symbol)
+        # Symbol-specific message, so error injection stays in the body
+        self._maybe_error("Failed to get crypto quote for {}", symbol)
 
         if symbol not in self._crypto_quotes:
-            raise Exception(f"Crypto quote not found for {symbol}")
+            raise _not_found("Crypto quote not found for {}", symbol, QuoteNotFound)
 
-        return self._crypto_quotes[symbol].copy()
+        return self._serve(self._crypto_quotes[symbol])
 
+    @_guard(0.02, error_msg="Failed to get estimated price")
     async def get_crypto_estimated_price(self, symbol: str, side: str, quantity: str) -> Dict[str, Any]:
         """Mock get estimated price for crypto trade."""
-        await self._simulate_delay(0.02)
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to get estimated price")
-
         # Return mock estimated price data
         return {
             "symbol": symbol,
@@ -433,18 +586,12 @@ class RobinhoodApiMock:
             "estimated_total": str(float(quantity) * 50000.00 + 5.00)
         }
 
-    async def place_crypto_order(self, **order_data) -> Dict[str, Any]:
+    @_guard(0.1, auth=True, error_msg="Failed to place crypto order")
+    async def place_crypto_order(self, **order_data) -> Mapping[str, Any]:
         """Mock place crypto order."""
-        await self._simulate_delay(0.1)
-
-        if not self.authenticated:
-            raise Exception("Not authenticated")
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to place crypto order")
-
-        order_id = f"crypto_order_{int(time.time() * 1000)}"
+        order_id = f"crypto_order_{next(self._crypto_order_seq)}"
         client_order_id = order_data.get("client_order_id", f"client_{order_id}")
+        now_iso = self._now_iso()
 
         order = {
             "id": order_id,
@@ -454,8 +601,8 @@ class RobinhoodApiMock:
             "symbol": order_data.get("symbol"),
             "quantity": order_data.get("quantity"),
             "status": "pending",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
 
         if "price" in order_data:
@@ -464,45 +611,34 @@ class RobinhoodApiMock:
             order["stop_price"] = order_data["stop_price"]
 
         self._crypto_orders[order_id] = order
-        return order
+        self._crypto_orders_by_symbol.setdefault(order["symbol"], {})[order_id] = None
+        return self._serve(order)
 
+    @_guard(0.04, error_msg="Failed to get crypto orders")
     async def get_crypto_orders(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Mock get crypto orders."""
-        await self._simulate_delay(0.04)
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to get crypto orders")
-
-        orders = list(self._crypto_orders.values())
         if symbol:
-            orders = [o for o in orders if o["symbol"] == symbol]
+            orders = self._crypto_orders
+            return {"results": self._serve_all(orders[i] for i in self._crypto_orders_by_symbol.get(symbol, ()))}
 
-        return {"results": orders}
+        return {"results": self._serve_all(self._crypto_orders.values())}
 
-    async def get_crypto_order(self, order_id: str) -> Dict[str, Any]:
+    @_guard(0.03)
+    async def get_crypto_order(self, order_id: str) -> Mapping[str, Any]:
         """Mock get specific crypto order."""
-        await self._simulate_delay(0.03)
-
         if order_id not in self._crypto_orders:
-            raise Exception(f"Crypto order {order_id} not found")
+            raise _not_found("Crypto order {} not found", order_id)
 
-        return self._crypto_orders[order_id].copy()
+        return self._serve(self._crypto_orders[order_id])
 
+    @_guard(0.05, auth=True, error_msg="Failed to cancel crypto order")
     async def cancel_crypto_order(self, order_id: str) -> Dict[str, Any]:
         """Mock cancel crypto order."""
-        await self._simulate_delay(0.05)
-
-        if not self.authenticated:
-            raise Exception("Not authenticated")
-
-        if self.error_mode and self._should_error():
-            raise Exception("Failed to cancel crypto order")
-
         if order_id in self._crypto_orders:
             self._crypto_orders[order_id]["status"] = "cancelled"
             return {"id": order_id, "status": "cancelled"}
 
-        raise Exception(f"Crypto order {order_id} not found")
+        raise _not_found("Crypto order {} not found", order_id)
 
     # Configuration methods
     def set_error_mode(self, enabled: bool = True, rate: float = 0.1):
@@ -513,65 +649,149 @@ class RobinhoodApiMock:
     def set_quote_price(self, symbol: str, price: float):
         """Set quote price for a symbol."""
         if symbol in self._quotes:
-            self._quotes[symbol]["ask_price"] = str(price)
-            self._quotes[symbol]["bid_price"] = str(price * 0.9998)
-            self._quotes[symbol]["last_trade_price"] = str(price)
+            # Copy-on-write so previously returned quote views stay unchanged
+            quote = dict(self._quotes[symbol])
+            quote["ask_price"] = str(price)
+            quote["bid_price"] = str(price * 0.9998)
+            quote["last_trade_price"] = str(price)
+            self._quotes[symbol] = quote
+            self._quote_records.pop(symbol, None)
 
     def add_position(self, symbol: str, quantity: str, avg_price: str):
         """Add a position for testing."""
-        self._positions[symbol] = {
+        symbol = sys.intern(symbol)
+        position = {
             "symbol": symbol,
             "quantity": quantity,
             "average_price": avg_price,
-            "current_price": self._quotes.get(symbol, {}).get("last_trade_price", "0"),
+            "current_price": _last_price(self._quotes, symbol),
             "unrealized_pnl": "0.00"
         }
+        self._positions[symbol] = position
+        self._positions_frozen[symbol] = MappingProxyType(position)
+        self._position_qty[symbol] = float(quantity)
 
     def clear_positions(self):
         """Clear all positions."""
         self._positions.clear()
+        self._positions_frozen.clear()
+        self._position_qty.clear()
+
+    def iter_orders(self, status: Optional[str] = None) -> Iterator[Mapping[str, Any]]:
+        """Iterate read-only order views without copying them into a list."""
+        if status:
+            orders = self._orders
+            return (MappingProxyType(orders[i]) for i in self._orders_by_status.get(status, ()))
+        return map(MappingProxyType, self._orders.values())
+
+    def iter_positions(self) -> Iterator[Mapping[str, Any]]:
+        """Iterate read-only position views without copying them into a list."""
+        return iter(self._positions_frozen.values())
+
+    @property
+    def request_count(self) -> int:
+        """Total number of simulated requests."""
+        return self._requests.n
+
+    @request_count.setter
+    def request_count(self, value: int):
+        self._requests.n = value
 
     def get_request_count(self) -> int:
         """Get total request count."""
-        return self.request_count
+        return self._requests.n
 
     def set_crypto_quote_price(self, symbol: str, price: float):
         """Set crypto quote price for a symbol."""
         if symbol in self._crypto_quotes:
-            self._crypto_quotes[symbol]["bid_price"] = str(price * 0.9998)
-            self._crypto_quotes[symbol]["ask_price"] = str(price * 1.0002)
-            self._crypto_quotes[symbol]["last_trade_price"] = str(price)
+            quote = dict(self._crypto_quotes[symbol])
+            quote["bid_price"] = str(price * 0.9998)
+            quote["ask_price"] = str(price * 1.0002)
+            quote["last_trade_price"] = str(price)
+            self._crypto_quotes[symbol] = quote
 
     def add_crypto_position(self, asset_code: str, quantity: str, avg_cost: str):
         """Add a crypto position for testing."""
-        self._crypto_positions[asset_code] = {
+        asset_code = sys.intern(asset_code)
+        price = _last_price(self._crypto_quotes, asset_code)
+        quantity_f = float(quantity)
+        price_f = float(price)
+        position = {
             "asset_code": asset_code,
             "quantity": quantity,
             "average_cost": avg_cost,
-            "current_price": self._crypto_quotes.get(asset_code, {}).get("last_trade_price", "0"),
-            "market_value": str(float(quantity) * float(self._crypto_quotes.get(asset_code, {}).get("last_trade_price", "0"))),
+            "current_price": price,
+            "market_value": f"{quantity_f * price_f:.2f}",
             "unrealized_pnl": "0.00",
             "unrealized_pnl_percent": "0.00"
         }
+        self._crypto_positions[asset_code] = position
+        self._crypto_positions_frozen[asset_code] = MappingProxyType(position)
+        self._crypto_position_numeric[asset_code] = (quantity_f, price_f)
+
+    def get_crypto_position_numeric(self, asset_code: str) -> Tuple[float, float]:
+        """Get a crypto position's (quantity, current_price) as floats."""
+        return self._crypto_position_numeric[asset_code]
 
     def clear_crypto_positions(self):
         """Clear all crypto positions."""
         self._crypto_positions.clear()
+        self._crypto_positions_frozen.clear()
+        self._crypto_position_numeric.clear()
 
     def clear_crypto_orders(self):
         """Clear all crypto orders."""
         self._crypto_orders.clear()
-
-    async def _simulate_delay(self, seconds: float):
-        """Simulate network delay."""
-        if seconds > 0:
-            await asyncio.sleep(seconds)
-        self.request_count += 1
+        self._crypto_orders_by_symbol.clear()
+
+    def _tick(self, seconds: float, force: bool = False) -> float:
+        """Count a request and return how long it should be delayed (0.0 when delays are off)."""
+        self._requests.n += 1
+        if not (self.delay_enabled or force):
+            return 0.0
+        if self._delay_override is not None:
+            return self._delay_override
+        return seconds
+
+    async def _simulate_delay(self, seconds: float, force: bool = False):
+        """Count a request and simulate network delay when delays are enabled."""
+        delay = self._tick(seconds, force)
+        if delay > 0:
+            await self._wait_delay_bucket(delay)
+
+    async def _wait_delay_bucket(self, seconds: float):
+        """Sleep until a shared 10ms deadline bucket so concurrent delays share one timer."""
+        loop = asyncio.get_running_loop()
+        deadline = math.ceil((loop.time() + seconds) * 100) / 100
+        event = self._pending_delays.get(deadline)
+        if event is None:
+            event = asyncio.Event()
+            self._pending_delays[deadline] = event
+            loop.call_at(deadline, self._release_delay_bucket, deadline)
+        await event.wait()
+
+    def _release_delay_bucket(self, deadline: float):
+        """Wake every request waiting on a delay bucket."""
+        self._pending_delays.pop(deadline).set()
+
+    def _now_iso(self) -> str:
+        """Current local time as an ISO string; the date and time part is reformatted once per second."""
+        now = time.time()
+        sec = int(now)
+        if sec != self._iso_cache[0]:
+            self._iso_cache = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec)))
+        return f"{self._iso_cache[1]}.{int((now - sec) * 1e6):06d}"
 
     def _should_error(self) -> bool:
         """Determine if request should error based on error rate."""
-        import random
-        return random.random() < self.error_rate
+        if self.error_rate <= 0.0:
+            return False
+        return self._rng.random() < self.error_rate
+
+    def _maybe_error(self, message: str, *args: Any) -> None:
+        """Raise a simulated failure when error mode triggers for this request."""
+        if self.error_mode and self._should_error():
+            raise Exception(_format_message(message, args))
 
 
 class MockApiClientBuilder:
@@ -617,11 +837,8 @@ class MockApiClientBuilder:
             mock.auth_token = self.config["auth_token"]
 
         if self.config["delay"] > 0:
-            # Patch the delay method to use configured delay
-            original_simulate_delay = mock._simulate_delay
-            async def custom_delay(seconds):
-                await original_simulate_delay(self.config["delay"])
-            mock._simulate_delay = custom_delay
+            mock._delay_override = self.config["delay"]
+            mock.delay_enabled = True
 
         if self.config["error_mode"]:
             mock.set_error_mode(True, self.config["error_rate"])
@@ -632,9 +849,13 @@ class MockApiClientBuilder:
 class EnhancedApiMock(RobinhoodApiMock):
     """Enhanced API mock with additional error scenarios and edge cases."""
 
+    # Share of requests dropped while the packet_loss condition is active
+    _PACKET_LOSS_THRESHOLD = 1 / 3
+
     def __init__(self):
         super().__init__()
         self._error_patterns = {}
+        self._error_pattern_re: Optional[re.Pattern] = None
         self._network_conditions = {}
         self._rate_limit_history = []
         self._response_delays = {}
@@ -645,6 +866,21 @@ class EnhancedApiMock(RobinhoodApiMock):
             'error_type': error_type,
             'frequency': frequency
         }
+        self._compile_error_patterns()
+
+    def _compile_error_patterns(self):
+        """Rebuild the single regex that finds any configured pattern in an endpoint."""
+        if self._error_patterns:
+            self._error_pattern_re = re.compile("|".join(map(re.escape, self._error_patterns)))
+        else:
+            self._error_pattern_re = None
+
+    def _match_error_pattern(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Config of the leftmost pattern found in the endpoint, if any."""
+        if self._error_pattern_re is None:
+            return None
+        match = self._error_pattern_re.search(endpoint)
+        return self._error_patterns[match.group(0)] if match else None
 
     def set_network_condition(self, condition: str, duration: float = 60.0):
         """Set network conditions like latency, packet loss, etc."""
@@ -663,6 +899,7 @@ class EnhancedApiMock(RobinhoodApiMock):
         # Check for active network conditions
         current_time = time.time()
         active_conditions = []
+        shaped = False
 
         for condition, config in self._network_conditions.items():
             if (config['active'] and
@@ -674,33 +911,31 @@ class EnhancedApiMock(RobinhoodApiMock):
         for condition in active_conditions:
             if condition == 'high_latency':
                 seconds += 1.0  # Add 1 second latency
+                shaped = True
             elif condition == 'packet_loss':
-                if time.time() % 3 < 1:  # 33% packet loss
+                if self._rng.random() < self._PACKET_LOSS_THRESHOLD:
                     raise Exception("Simulated packet loss")
 
         # Apply variable delays
         if hasattr(self, '_current_endpoint') and self._current_endpoint in self._response_delays:
             min_delay, max_delay = self._response_delays[self._current_endpoint]
-            import random
-            seconds = random.uniform(min_delay, max_delay)
+            seconds = self._rng.uniform(min_delay, max_delay)
+            shaped = True
 
-        await self._simulate_delay(seconds)
+        # Explicitly configured network conditions always take effect
+        await self._simulate_delay(seconds, force=shaped)
 
     def should_error_for_endpoint(self, endpoint: str) -> bool:
         """Check if an endpoint should return an error based on patterns."""
-        for pattern, config in self._error_patterns.items():
-            if pattern in endpoint:
-                import random
-                return random.random() < config['frequency']
-
-        return False
+        config = self._match_error_pattern(endpoint)
+        if config is None:
+            return False
+        return self._rng.random() < config['frequency']
 
     def get_error_for_endpoint(self, endpoint: str) -> Optional[str]:
         """Get the error type for a specific endpoint."""
-        for pattern, config in self._error_patterns.items():
-            if pattern in endpoint:
-                return config['error_type']
-        return None
+        config = self._match_error_pattern(endpoint)
+        return config['error_type'] if config else None
 
     async def simulate_rate_limit_exceeded(self):
         """Simulate rate limit exceeded scenario."""
@@ -728,8 +963,7 @@ class EnhancedApiMock(RobinhoodApiMock):
 
     async def simulate_large_response(self, size_mb: float = 1.0):
         """Simulate large response."""
-        large_data = "x" * int(size_mb * 1024 * 1024)  # Create large string
-        return {"data": large_data}
+        return {"data": _large_payload(int(size_mb * 1024 * 1024))}
 
     def get_rate_limit_history(self) -> List[Dict[str, Any]]:
         """Get rate limit event history."""
@@ -738,6 +972,7 @@ class EnhancedApiMock(RobinhoodApiMock):
     def clear_error_patterns(self):
         """Clear all error patterns."""
         self._error_patterns.clear()
+        self._error_pattern_re = None
 
     def clear_network_conditions(self):
         """Clear all network conditions."""
@@ -786,58 +1021,96 @@ class MockScenarioBuilder:
 
 
 class ScenarioMock:
-    """Mock that executes predefined scenarios."""
+    """Mock that executes predefined scenarios.
+
+    The steps are copied and indexed when the scenario is built, so adding
+    steps to the builder afterwards does not change an existing scenario;
+    build a new one instead.
+    """
 
     def __init__(self, base_mock: EnhancedApiMock, steps: List[Dict[str, Any]]):
         self.base_mock = base_mock
-        self.steps = steps
+        # Frozen at construction; the lookup tables below are built from it
+        self.steps = tuple(steps)
         self.current_step = 0
         self.request_count = 0
 
+        # Only response steps ahead of the first non-response step can ever be
+        # selected; that first non-response step applies to every other request.
+        # The first step for each endpoint wins, so later duplicates are dropped.
+        self._endpoint_suffix_map: Dict[str, Any] = {}
+        self._general_step: Optional[Dict[str, Any]] = None
+        for step in self.steps:
+            if step['type'] != 'response':
+                self._general_step = step
+                break
+            self._endpoint_suffix_map.setdefault(step['config']['endpoint'], step['config']['response'])
+
+        # Exact endpoints that no earlier step would match first; these skip the scan
+        self._exact_responses: Dict[str, Any] = {}
+        seen: List[str] = []
+        for step_endpoint, response in self._endpoint_suffix_map.items():
+            if not any(earlier in step_endpoint for earlier in seen):
+                self._exact_responses[step_endpoint] = response
+            seen.append(step_endpoint)
+
+        self._handlers = {
+            'delay': self._handle_delay,
+            'error': self._handle_error,
+            'rate_limit': self._handle_rate_limit,
+            'network_condition': self._handle_network_condition
+        }
+
     async def execute_request(self, method: str, endpoint: str, **kwargs):
         """Execute a request according to the current scenario step."""
         self.request_count += 1
 
-        # Find matching step
-        current_step = None
-        for step in self.steps:
-            if step['type'] == 'response' and step['config']['endpoint'] in endpoint:
-                current_step = step
-                break
-            elif step['type'] != 'response':  # Non-response steps apply to all requests
-                current_step = step
-                break
-
-        if current_step:
-            step_type = current_step['type']
-            step_config = current_step['config']
-
-            if step_type == 'delay':
-                await self.base_mock._simulate_delay(step_config['seconds'])
-            elif step_type == 'error':
-                if step_config.get('pattern', '*') in endpoint:
-                    error_type = step_config['error_type']
-                    if error_type == 'timeout':
-                        raise asyncio.TimeoutError("Simulated timeout")
-                    elif error_type == 'network':
-                        raise Exception("Simulated network error")
-                    elif error_type == 'auth':
-                        from src.core.api.exceptions import AuthenticationError
-                        raise AuthenticationError("Simulated auth error")
-            elif step_type == 'rate_limit':
-                if self.request_count >= step_config['request_count']:
-                    await self.base_mock.simulate_rate_limit_exceeded()
-            elif step_type == 'network_condition':
-                # Apply network condition if active
-                pass
-            elif step_type == 'response':
-                return step_config['response']
-
-        # Default behavior - delegate to base mock
-        return await self.base_mock._simulate_request(method, endpoint, **kwargs)
+        exact = self._exact_responses
+        if endpoint in exact:
+            return exact[endpoint]
+
+        for step_endpoint, response in self._endpoint_suffix_map.items():
+            if step_endpoint in endpoint:
+                return response
+
+        step = self._general_step
+        if step is not None:
+            handler = self._handlers.get(step['type'])
+            if handler is not None:
+                await handler(step['config'], endpoint)
+
+        # Default behavior - generic simulated response
+        return await self._simulate_request(method, endpoint, **kwargs)
+
+    async def _handle_delay(self, config: Dict[str, Any], endpoint: str):
+        """Apply a scenario delay step."""
+        await self.base_mock._simulate_delay(config['seconds'], force=True)
+
+    async def _handle_error(self, config: Dict[str, Any], endpoint: str):
+        """Raise the configured error when the endpoint matches the step pattern."""
+        if config.get('pattern', '*') not in endpoint:
+            return
+
+        error_type = config['error_type']
+        if error_type == 'timeout':
+            raise asyncio.TimeoutError("Simulated timeout")
+        elif error_type == 'network':
+            raise Exception("Simulated network error")
+        elif error_type == 'auth':
+            from src.core.api.exceptions import AuthenticationError
+            raise AuthenticationError("Simulated auth error")
+
+    async def _handle_rate_limit(self, config: Dict[str, Any], endpoint: str):
+        """Trip the rate limit once the scenario request budget is used up."""
+        if self.request_count >= config['request_count']:
+            await self.base_mock.simulate_rate_limit_exceeded()
+
+    async def _handle_network_condition(self, config: Dict[str, Any], endpoint: str):
+        """Apply network condition if active."""
+        pass
 
     async def _simulate_request(self, method: str, endpoint: str, **kwargs):
         """Simulate a request (placeholder for actual implementation)."""
         # This would be implemented to delegate to the appropriate mock method
         # For now, return a generic response
-        return {"data": "mock_response", "endpoint": endpoint, "method": method}
\ No newline at end of file
+        return {"data": "mock_response", "endpoint": endpoint, "method": method}
@@ -2,22 +2,109 @@
 Mock implementation for Redis client.
 """
 import asyncio
+import bisect
+import fnmatch
+import heapq
 import json
+import re
+import sys
 import time
-from typing import Any, Dict, List, Optional, Union, Set
+from typing import Any, Dict, List, Optional, Union, Set, Tuple
 from unittest.mock import Mock
-from collections import defaultdict
+from collections import deque
+from functools import lru_cache, wraps
+from itertools import islice
 
 
-class RedisMock:
-    """Comprehensive mock for Redis client with realistic behavior."""
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a Redis glob pattern (*, ?, [...]) to a regex."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+# Keyspace size from which keys() matches one joined buffer instead of each key
+_SWEEP_MIN_KEYS = 256
+_KEY_SEP = "\x00"
+
+
+@lru_cache(maxsize=128)
+def _compile_sweep(pattern: str) -> Optional[re.Pattern]:
+    """Compile a glob using only * and ? to a regex over _KEY_SEP-joined keys.
+
+    Returns None for patterns with character classes or escapes, which keep
+    the per-key path.
+    """
+    if "[" in pattern or "\\" in pattern or _KEY_SEP in pattern:
+        return None
+    body = "".join(
+        "[^\x00]*" if char == "*" else "[^\x00]" if char == "?" else re.escape(char)
+        for char in pattern
+    )
+    # Anchor each match to a whole key between separators
+    return re.compile(f"(?<![^\x00]){body}(?![^\x00])")
+
+
+# Default for dict.pop so one call both removes an entry and reports whether it existed
+_MISSING = object()
+
+
+def _intern_key(key: str) -> str:
+    """Intern a short key loaded in bulk, so later lookups can match by identity.
+
+    Only worth it for keys stored once and read many times; interning on
+    every command costs more than the comparisons it saves.
+    """
+    return sys.intern(key) if type(key) is str and len(key) < 64 else key
+
+
+def _to_str(value: Any) -> str:
+    """Coerce a value to the string form Redis stores."""
+    return value if type(value) is str else str(value)
+
+
+class _SortedSet:
+    """Sorted set kept as a (score, member) list in order plus a member -> score index."""
+
+    __slots__ = ("entries", "scores")
+
+    def __init__(self):
+        self.entries: List[Tuple[float, str]] = []
+        self.scores: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def add(self, member: str, score: float):
+        """Insert a member, moving it if it already has a score."""
+        old_score = self.scores.get(member)
+        if old_score is not None:
+            del self.entries[bisect.bisect_left(self.entries, (old_score, member))]
+        bisect.insort(self.entries, (score, member))
+        self.scores[member] = score
+
+    def remove(self, member: str) -> bool:
+        """Remove a member, returning whether it was present."""
+        score = self.scores.pop(member, _MISSING)
+        if score is _MISSING:
+            return False
+        del self.entries[bisect.bisect_left(self.entries, (score, member))]
+        return True
+
+
+class _RedisStore:
+    """Storage and command logic shared by the async and sync Redis mocks."""
+
+    # Released instances waiting to be reused by RedisMockBuilder.build;
+    # each concrete mock class keeps its own pool
+    _pool: List['_RedisStore']
 
     def __init__(self):
         self.data = {}  # Main key-value storage
-        self.hashes = defaultdict(dict)  # Hash storage
-        self.lists = defaultdict(list)  # List storage
-        self.sets = defaultdict(set)  # Set storage
-        self.sorted_sets = defaultdict(dict)  # Sorted set storage
+        self.hashes: Dict[str, Dict[str, str]] = {}  # Hash storage
+        # Plain dicts: reads use .get so a miss never creates an empty container
+        self.lists: Dict[str, deque] = {}  # List storage
+        self.sets: Dict[str, Set[str]] = {}  # Set storage
+        self.sorted_sets: Dict[str, _SortedSet] = {}  # Sorted set storage
 
         # Operation tracking
         self.operation_count = 0
@@ -25,377 +112,376 @@ class RedisMock:
         self.delay = 0.0  # Simulate network delay
 
         # Expiration tracking
-        self.expirations = {}  # key -> timestamp
+        self.expirations = {}  # key -> time.monotonic() deadline
+        # Min-heap of (timestamp, key); entries whose timestamp no longer
+        # matches expirations[key] are stale and skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
 
-    async def get(self, key: str) -> Optional[str]:
+    def _get_impl(self, key: str) -> Optional[str]:
         """Get value for key."""
-        await self._simulate_delay()
-
-        if not self._key_exists(key):
-            return None
-
-        if self._is_expired(key):
-            del self.data[key]
-            return None
-
-        return self.data[key]
+        self._evict_expired(time.monotonic())
+        return self.data.get(key)
 
-    async def set(self, key: str, value: Any, ex: Optional[int] = None,
+    def _set_impl(self, key: str, value: Any, ex: Optional[int] = None,
                   px: Optional[int] = None, nx: bool = False, xx: bool = False) -> bool:
         """Set value for key with optional expiration and conditions."""
-        await self._simulate_delay()
+        # Plain string write with no options: no conditions or deadline to work out
+        if ex is None and px is None and not nx and not xx and type(value) is str:
+            self.data[key] = value
+            self.expirations.pop(key, None)
+            return True
 
         # Check conditions
+        now = time.monotonic()
+        self._evict_expired(now)
         exists = key in self.data
         if nx and exists:
             return False
         if xx and not exists:
             return False
 
-        self.data[key] = str(value) if not isinstance(value, str) else value
-        self._set_expiration(key, ex, px)
+        self.data[key] = _to_str(value)
+        self._set_expiration(key, ex, px, now=now)
         return True
 
-    async def delete(self, *keys: str) -> int:
+    def _delete_impl(self, *keys: str) -> int:
         """Delete keys and return count of deleted keys."""
-        await self._simulate_delay()
-
         deleted_count = 0
         for key in keys:
             if key in self.data:
                 del self.data[key]
                 deleted_count += 1
-                if key in self.expirations:
-                    del self.expirations[key]
+                self.expirations.pop(key, None)
 
         return deleted_count
 
-    async def exists(self, *keys: str) -> int:
+    def _exists_impl(self, *keys: str) -> int:
         """Check if keys exist."""
-        await self._simulate_delay()
-
+        self._evict_expired(time.monotonic())
+        data = self.data
         existing_count = 0
         for key in keys:
-            if self._key_exists(key) and not self._is_expired(key):
+            if key in data:
                 existing_count += 1
 
         return existing_count
 
-    async def expire(self, key: str, seconds: int) -> bool:
+    def _expire_impl(self, key: str, seconds: int) -> bool:
         """Set expiration for key in seconds."""
-        await self._simulate_delay()
-
+        now = time.monotonic()
+        self._evict_expired(now)
         if key not in self.data:
             return False
 
-        self._set_expiration(key, seconds)
+        self._set_expiration(key, seconds, now=now)
         return True
 
-    async def ttl(self, key: str) -> int:
+    def _ttl_impl(self, key: str) -> int:
         """Get time to live for key."""
-        await self._simulate_delay()
-
+        now = time.monotonic()
+        self._evict_expired(now)
         if key not in self.data:
             return -2
 
-        if key not in self.expirations:
+        expires_at = self.expirations.get(key)
+        if expires_at is None:
             return -1
 
-        remaining = self.expirations[key] - time.time()
+        remaining = expires_at - now
         return max(-1, int(remaining))
 
-    async def keys(self, pattern: str = "*") -> List[str]:
+    def _keys_impl(self, pattern: str = "*") -> List[str]:
         """Get keys matching pattern."""
-        await self._simulate_delay()
-
+        self._evict_expired(time.monotonic())
         if pattern == "*":
-            keys = [k for k in self.data.keys() if not self._is_expired(k)]
+            keys = list(self.data.keys())
         else:
-            # Simple pattern matching (supports * wildcards)
-            keys = []
-            for key in self.data.keys():
-                if self._matches_pattern(key, pattern) and not self._is_expired(key):
-                    keys.append(key)
+            keys = None
+            if len(self.data) >= _SWEEP_MIN_KEYS and (sweep := _compile_sweep(pattern)) is not None:
+                buffer = _KEY_SEP.join(self.data)
+                # Keys that contain the separator themselves need per-key matching
+                if buffer.count(_KEY_SEP) == len(self.data) - 1:
+                    keys = sweep.findall(buffer)
+            if keys is None:
+                match = _compile_pattern(pattern).match
+                keys = [k for k in self.data.keys() if match(k)]
 
         return keys
 
-    async def flushall(self) -> bool:
+    def _flushall_impl(self) -> bool:
         """Clear all data."""
-        await self._simulate_delay()
-
-        self.data.clear()
-        self.hashes.clear()
-        self.lists.clear()
-        self.sets.clear()
-        self.sorted_sets.clear()
-        self.expirations.clear()
-
+        self._clear_data()
         return True
 
     # Hash operations
-    async def hget(self, key: str, field: str) -> Optional[str]:
+    def _hget_impl(self, key: str, field: str) -> Optional[str]:
         """Get field value from hash."""
-        await self._simulate_delay()
-
-        if not self._key_exists(key):
+        fields = self.hashes.get(key)
+        if fields is None:
             return None
 
-        return self.hashes[key].get(field)
+        return fields.get(field)
 
-    async def hset(self, key: str, field: str, value: Any) -> int:
+    def _hset_impl(self, key: str, field: str, value: Any) -> int:
         """Set field in hash."""
-        await self._simulate_delay()
-
-        if key not in self.hashes:
-            self.hashes[key] = {}
-
-        old_value = field in self.hashes[key]
-        self.hashes[key][field] = str(value) if not isinstance(value, str) else value
+        fields = self.hashes.setdefault(key, {})
+        old_value = field in fields
+        fields[field] = _to_str(value)
 
         return 0 if old_value else 1
 
-    async def hgetall(self, key: str) -> Dict[str, str]:
+    def _hgetall_impl(self, key: str) -> Dict[str, str]:
         """Get all fields and values from hash."""
-        await self._simulate_delay()
-
-        if not self._key_exists(key):
+        fields = self.hashes.get(key)
+        if fields is None:
             return {}
 
-        return self.hashes[key].copy()
+        return fields.copy()
 
-    async def hdel(self, key: str, *fields: str) -> int:
+    def _hdel_impl(self, key: str, *fields: str) -> int:
         """Delete fields from hash."""
-        await self._simulate_delay()
-
-        if key not in self.hashes:
+        hash_fields = self.hashes.get(key)
+        if hash_fields is None:
             return 0
 
         deleted_count = 0
         for field in fields:
-            if field in self.hashes[key]:
-                del self.hashes[key][field]
+            if hash_fields.pop(field, _MISSING) is not _MISSING:
                 deleted_count += 1
 
         return deleted_count
 
-    async def hexists(self, key: str, field: str) -> bool:
+    def _hexists_impl(self, key: str, field: str) -> bool:
         """Check if field exists in hash."""
-        await self._simulate_delay()
+        fields = self.hashes.get(key)
+        return fields is not None and field in fields
 
-        return key in self.hashes and field in self.hashes[key]
-
-    async def hlen(self, key: str) -> int:
+    def _hlen_impl(self, key: str) -> int:
         """Get number of fields in hash."""
-        await self._simulate_delay()
-
-        if key not in self.hashes:
-            return 0
-
-        return len(self.hashes[key])
+        fields = self.hashes.get(key)
+        return len(fields) if fields is not None else 0
 
     # List operations
-    async def lpush(self, key: str, *values: Any) -> int:
+    def _lpush_impl(self, key: str, *values: Any) -> int:
         """Push values to left of list."""
-        await self._simulate_delay()
-
-        if key not in self.lists:
-            self.lists[key] = []
-
-        for value in values:
-            self.lists[key].insert(0, str(value) if not isinstance(value, str) else value)
+        items = self.lists.get(key)
+        if items is None:
+            items = self.lists[key] = deque()
+        # extendleft pushes each value to the head in turn, like LPUSH
+        items.extendleft(map(_to_str, values))
 
-        return len(self.lists[key])
+        return len(items)
 
-    async def rpush(self, key: str, *values: Any) -> int:
+    def _rpush_impl(self, key: str, *values: Any) -> int:
         """Push values to right of list."""
-        await self._simulate_delay()
+        items = self.lists.get(key)
+        if items is None:
+            items = self.lists[key] = deque()
+        items.extend(map(_to_str, values))
 
-        if key not in self.lists:
-            self.lists[key] = []
+        return len(items)
 
-        for value in values:
-            self.lists[key].append(str(value) if not isinstance(value, str) else value)
-
-        return len(self.lists[key])
-
-    async def lpop(self, key: str) -> Optional[str]:
+    def _lpop_impl(self, key: str) -> Optional[str]:
         """Pop value from left of list."""
-        await self._simulate_delay()
-
-        if key not in self.lists or not self.lists[key]:
+        items = self.lists.get(key)
+        if not items:
             return None
 
-        return self.lists[key].pop(0)
+        return items.popleft()
 
-    async def rpop(self, key: str) -> Optional[str]:
+    def _rpop_impl(self, key: str) -> Optional[str]:
         """Pop value from right of list."""
-        await self._simulate_delay()
-
-        if key not in self.lists or not self.lists[key]:
+        items = self.lists.get(key)
+        if not items:
             return None
 
-        return self.lists[key].pop()
+        return items.pop()
 
-    async def llen(self, key: str) -> int:
+    def _llen_impl(self, key: str) -> int:
         """Get length of list."""
-        await self._simulate_delay()
+        items = self.lists.get(key)
+        return len(items) if items is not None else 0
 
-        if key not in self.lists:
-            return 0
-
-        return len(self.lists[key])
-
-    async def lrange(self, key: str, start: int, stop: int) -> List[str]:
+    def _lrange_impl(self, key: str, start: int, stop: int) -> List[str]:
         """Get range of values from list."""
-        await self._simulate_delay()
-
-        if key not in self.lists:
+        items = self.lists.get(key)
+        if items is None:
             return []
 
-        return self.lists[key][start:stop+1]
+        length = len(items)
+        # Negative indexes count from the tail and stop is inclusive, as in LRANGE
+        if start < 0:
+            start = max(length + start, 0)
+        if stop < 0:
+            stop += length
+        return list(islice(items, start, max(stop + 1, start)))
 
     # Set operations
-    async def sadd(self, key: str, *members: Any) -> int:
+    def _sadd_impl(self, key: str, *members: Any) -> int:
         """Add members to set."""
-        await self._simulate_delay()
-
-        if key not in self.sets:
-            self.sets[key] = set()
-
-        added_count = 0
-        for member in members:
-            member_str = str(member) if not isinstance(member, str) else member
-            if member_str not in self.sets[key]:
-                self.sets[key].add(member_str)
-                added_count += 1
-
-        return added_count
-
-    async def srem(self, key: str, *members: Any) -> int:
+        members_set = self.sets.get(key)
+        if members_set is None:
+            members_set = self.sets[key] = set()
+        before = len(members_set)
+        members_set.update(map(_to_str, members))
+        return len(members_set) - before
+
+    def _srem_impl(self, key: str, *members: Any) -> int:
         """Remove members from set."""
-        await self._simulate_delay()
-
-        if key not in self.sets:
+        members_set = self.sets.get(key)
+        if members_set is None:
             return 0
 
-        removed_count = 0
-        for member in members:
-            member_str = str(member) if not isinstance(member, str) else member
-            if member_str in self.sets[key]:
-                self.sets[key].remove(member_str)
-                removed_count += 1
+        before = len(members_set)
+        members_set.difference_update(map(_to_str, members))
+        return before - len(members_set)
 
-        return removed_count
-
-    async def smembers(self, key: str) -> Set[str]:
+    def _smembers_impl(self, key: str) -> Set[str]:
         """Get all members of set."""
-        await self._simulate_delay()
-
-        if key not in self.sets:
+        members_set = self.sets.get(key)
+        if members_set is None:
             return set()
 
-        return self.sets[key].copy()
+        return members_set.copy()
 
-    async def scard(self, key: str) -> int:
+    def _scard_impl(self, key: str) -> int:
         """Get cardinality of set."""
-        await self._simulate_delay()
-
-        if key not in self.sets:
-            return 0
+        members_set = self.sets.get(key)
+        return len(members_set) if members_set is not None else 0
 
-        return len(self.sets[key])
-
-    async def sismember(self, key: str, member: Any) -> bool:
+    def _sismember_impl(self, key: str, member: Any) -> bool:
         """Check if member is in set."""
-        await self._simulate_delay()
-
-        member_str = str(member) if not isinstance(member, str) else member
-        return key in self.sets and member_str in self.sets[key]
+        members_set = self.sets.get(key)
+        return members_set is not None and _to_str(member) in members_set
 
     # Sorted set operations
-    async def zadd(self, key: str, score: float, member: Any) -> int:
+    def _zadd_impl(self, key: str, score: float, member: Any) -> int:
         """Add member to sorted set with score."""
-        await self._simulate_delay()
-
-        if key not in self.sorted_sets:
-            self.sorted_sets[key] = {}
-
-        member_str = str(member) if not isinstance(member, str) else member
-        self.sorted_sets[key][member_str] = score
+        sorted_set = self.sorted_sets.get(key)
+        if sorted_set is None:
+            sorted_set = self.sorted_sets[key] = _SortedSet()
+        sorted_set.add(_to_str(member), score)
 
         return 1
 
-    async def zrem(self, key: str, *members: Any) -> int:
+    def _zrem_impl(self, key: str, *members: Any) -> int:
         """Remove members from sorted set."""
-        await self._simulate_delay()
-
-        if key not in self.sorted_sets:
+        sorted_set = self.sorted_sets.get(key)
+        if sorted_set is None:
             return 0
 
         removed_count = 0
         for member in members:
-            member_str = str(member) if not isinstance(member, str) else member
-            if member_str in self.sorted_sets[key]:
-                del self.sorted_sets[key][member_str]
+            if sorted_set.remove(_to_str(member)):
                 removed_count += 1
 
         return removed_count
 
-    async def zcard(self, key: str) -> int:
+    def _zcard_impl(self, key: str) -> int:
         """Get cardinality of sorted set."""
-        await self._simulate_delay()
-
-        if key not in self.sorted_sets:
-            return 0
+        sorted_set = self.sorted_sets.get(key)
+        return len(sorted_set) if sorted_set is not None else 0
+
+    def _zrange_impl(self, key: str, start: int, stop: int,
+                     withscores: bool = False) -> List[Union[str, Tuple[str, float]]]:
+        """Get members of sorted set by rank, lowest score first."""
+        sorted_set = self.sorted_sets.get(key)
+        if sorted_set is None:
+            return []
 
-        return len(self.sorted_sets[key])
+        entries = sorted_set.entries
+        length = len(entries)
+        if start < 0:
+            start = max(length + start, 0)
+        if stop < 0:
+            stop += length
+        window = entries[start:max(stop + 1, start)]
+        if withscores:
+            return [(member, score) for score, member in window]
+        return [member for _, member in window]
 
     # Utility methods
-    def _key_exists(self, key: str) -> bool:
-        """Check if key exists and is not expired."""
-        return key in self.data
-
-    def _is_expired(self, key: str) -> bool:
-        """Check if key is expired."""
-        if key not in self.expirations:
-            return False
-
-        return time.time() > self.expirations[key]
-
     def _set_expiration(self, key: str, seconds: Optional[int] = None,
-                       milliseconds: Optional[int] = None):
+                       milliseconds: Optional[int] = None, now: Optional[float] = None):
         """Set expiration for key."""
+        if now is None:
+            now = time.monotonic()
         if seconds:
-            self.expirations[key] = time.time() + seconds
+            expires_at = now + seconds
         elif milliseconds:
-            self.expirations[key] = time.time() + (milliseconds / 1000)
-        elif key in self.expirations:
-            del self.expirations[key]
+            expires_at = now + (milliseconds / 1000)
+        else:
+            self.expirations.pop(key, None)
+            return
+
+        expirations = self.expirations
+        expirations[key] = expires_at
+        heap = self._expiry_heap
+        heapq.heappush(heap, (expires_at, key))
+        # Superseded entries stay queued until their own deadline; rebuild the
+        # heap from the live deadlines once they make up most of it
+        if len(heap) > 2 * len(expirations):
+            heap[:] = [(deadline, name) for name, deadline in expirations.items()]
+            heapq.heapify(heap)
+
+    def _evict_expired(self, now: float):
+        """Drop every key whose expiration time has passed."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            if self.expirations.get(key) == expires_at:
+                del self.expirations[key]
+                self.data.pop(key, None)
+
+    def _tick(self) -> float:
+        """Count an operation and return the delay to simulate for it."""
+        self.operation_count += 1
+        return self.delay
 
-    def _matches_pattern(self, key: str, pattern: str) -> bool:
-        """Simple pattern matching for keys."""
-        # Basic implementation - in real Redis this would be more sophisticated
-        if pattern == "*":
-            return True
+    def _untracked_tick(self) -> float:
+        """Return the delay to simulate without counting the operation."""
+        return self.delay
 
-        # Simple wildcard matching
-        pattern_parts = pattern.split("*")
-        if len(pattern_parts) == 2:
-            return key.startswith(pattern_parts[0]) and key.endswith(pattern_parts[1])
+    def _clear_data(self):
+        """Empty every store in place."""
+        self.data.clear()
+        self.hashes.clear()
+        self.lists.clear()
+        self.sets.clear()
+        self.sorted_sets.clear()
+        self.expirations.clear()
+        self._expiry_heap.clear()
 
-        return key == pattern
+    # Configuration methods
+    def reset(self):
+        """Restore a freshly constructed state, keeping the allocated stores."""
+        self._clear_data()
+        self.operation_count = 0
+        self.errors.clear()
+        self.delay = 0.0
+        self.set_operation_tracking(True)
 
-    async def _simulate_delay(self):
-        """Simulate network delay."""
-        if self.delay > 0:
-            await asyncio.sleep(self.delay)
-        self.operation_count += 1
+    def release(self):
+        """Hand this instance back for reuse by RedisMockBuilder.build."""
+        pool = type(self)._pool
+        if not any(pooled is self for pooled in pool):
+            pool.append(self)
 
-    # Configuration methods
     def set_delay(self, seconds: float):
         """Set delay for all operations."""
         self.delay = seconds
 
+    def set_operation_tracking(self, enabled: bool = True):
+        """Enable or disable operation counting.
+
+        The choice is bound into the instance's _tick, so commands do no
+        per-call flag check either way.
+        """
+        if enabled:
+            self.__dict__.pop("_tick", None)
+        else:
+            self._tick = self._untracked_tick
+
     def add_error(self, error: str):
         """Add an error to be raised on next operation."""
         self.errors.append(error)
@@ -421,6 +507,164 @@ class RedisMock:
         }
 
 
+class _Pipeline:
+    """Queues mock Redis commands to run together with one simulated round trip."""
+
+    def __init__(self, mock: _RedisStore):
+        self._mock = mock
+        self._commands: List[Tuple[Any, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        if name not in _PIPELINE_COMMANDS:
+            raise AttributeError(name)
+        impl = getattr(self._mock, f"_{name}_impl")
+
+        def queue(*args: Any, **kwargs: Any) -> '_Pipeline':
+            self._commands.append((impl, args, kwargs))
+            return self
+        return queue
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def reset(self):
+        """Drop queued commands."""
+        self._commands.clear()
+
+    def _begin(self) -> float:
+        """Count each queued command and return the delay for the whole batch."""
+        delay = 0.0
+        for _ in self._commands:
+            delay = self._mock._tick()
+        return delay
+
+    def _run(self, raise_on_error: bool) -> List[Any]:
+        """Run the queued commands in order and clear the queue.
+
+        Like redis-py, a failing command does not stop the ones after it: its
+        exception takes its place in the results, and the first one is raised
+        afterwards when ``raise_on_error`` is set.
+        """
+        commands, self._commands = self._commands, []
+        results = []
+        first_error = None
+        for impl, args, kwargs in commands:
+            try:
+                results.append(impl(*args, **kwargs))
+            except Exception as e:
+                results.append(e)
+                if first_error is None:
+                    first_error = e
+        if raise_on_error and first_error is not None:
+            raise first_error
+        return results
+
+
+class RedisMockPipeline(_Pipeline):
+    """Pipeline for RedisMock; execute() awaits the delay once per batch."""
+
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        """Run queued commands and return their results in order."""
+        if (delay := self._begin()) > 0:
+            await asyncio.sleep(delay)
+        return self._run(raise_on_error)
+
+    async def __aenter__(self) -> 'RedisMockPipeline':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.reset()
+
+
+class RedisMockSyncPipeline(_Pipeline):
+    """Pipeline for RedisMockSync; execute() sleeps once per batch."""
+
+    def execute(self, raise_on_error: bool = True) -> List[Any]:
+        """Run queued commands and return their results in order."""
+        if (delay := self._begin()) > 0:
+            time.sleep(delay)
+        return self._run(raise_on_error)
+
+    def __enter__(self) -> 'RedisMockSyncPipeline':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.reset()
+
+
+# Commands a pipeline can queue: every _<command>_impl on the shared store
+_PIPELINE_COMMANDS = frozenset(
+    name[1:-len("_impl")] for name in vars(_RedisStore)
+    if name.startswith("_") and name.endswith("_impl")
+)
+
+
+def _async_command(name: str):
+    """Build RedisMock's awaitable wrapper around _<name>_impl."""
+    impl_name = f"_{name}_impl"
+
+    @wraps(getattr(_RedisStore, impl_name))
+    async def command(self, *args: Any, **kwargs: Any) -> Any:
+        if (delay := self._tick()) > 0:
+            await asyncio.sleep(delay)
+        return getattr(self, impl_name)(*args, **kwargs)
+    return command
+
+
+def _sync_command(name: str):
+    """Build RedisMockSync's blocking wrapper around _<name>_impl."""
+    impl_name = f"_{name}_impl"
+
+    @wraps(getattr(_RedisStore, impl_name))
+    def command(self, *args: Any, **kwargs: Any) -> Any:
+        if (delay := self._tick()) > 0:
+            time.sleep(delay)
+        return getattr(self, impl_name)(*args, **kwargs)
+    return command
+
+
+def _with_commands(factory):
+    """Class decorator adding one public method per pipeline command."""
+    def decorate(cls):
+        for name in sorted(_PIPELINE_COMMANDS):
+            command = factory(name)
+            command.__name__ = name
+            command.__qualname__ = f"{cls.__qualname__}.{name}"
+            setattr(cls, name, command)
+        return cls
+    return decorate
+
+
+@_with_commands(_async_command)
+class RedisMock(_RedisStore):
+    """Comprehensive mock for Redis client with realistic behavior.
+
+    Each command (get, set, hget, lpush, zrange, ...) is an awaitable wrapper
+    generated from the matching _<command>_impl on _RedisStore.
+    """
+
+    _pool: List['RedisMock'] = []
+
+    def pipeline(self) -> RedisMockPipeline:
+        """Start a pipeline that runs queued commands with a single delay."""
+        return RedisMockPipeline(self)
+
+
+@_with_commands(_sync_command)
+class RedisMockSync(_RedisStore):
+    """Synchronous Redis mock with the same commands as RedisMock.
+
+    For tests that do not need an event loop; configured delays block with
+    time.sleep.
+    """
+
+    _pool: List['RedisMockSync'] = []
+
+    def pipeline(self) -> RedisMockSyncPipeline:
+        """Start a pipeline that runs queued commands with a single delay."""
+        return RedisMockSyncPipeline(self)
+
+
 class RedisMockBuilder:
     """Builder for creating customized Redis mocks."""
 
@@ -428,7 +672,8 @@ class RedisMockBuilder:
         self.config = {
             "delay": 0.0,
             "prepopulate_data": {},
-            "errors": []
+            "errors": [],
+            "sync": False
         }
 
     def with_delay(self, seconds: float) -> 'RedisMockBuilder':
@@ -446,9 +691,19 @@ class RedisMockBuilder:
         self.config["errors"].append(error)
         return self
 
-    def build(self) -> RedisMock:
-        """Build the configured Redis mock."""
-        mock = RedisMock()
+    def with_sync(self, enabled: bool = True) -> 'RedisMockBuilder':
+        """Build a RedisMockSync with plain (non-async) commands instead."""
+        self.config["sync"] = enabled
+        return self
+
+    def build(self) -> Union[RedisMock, RedisMockSync]:
+        """Build the configured Redis mock, reusing a released instance if any."""
+        mock_class = RedisMockSync if self.config["sync"] else RedisMock
+        if mock_class._pool:
+            mock = mock_class._pool.pop()
+            mock.reset()
+        else:
+            mock = mock_class()
 
         # Set delay
         if self.config["delay"] > 0:
@@ -456,7 +711,7 @@ class RedisMockBuilder:
 
         # Pre-populate data
         for key, value in self.config["prepopulate_data"].items():
-            mock.data[key] = str(value) if not isinstance(value, str) else value
+            mock.data[_intern_key(key)] = _to_str(value)
 
         # Add errors
         for error in self.config["errors"]:
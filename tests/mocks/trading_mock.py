@@ -2,14 +2,17 @@
 Mock implementations for trading components.
 """
 import asyncio
-import time
+import itertools
+from collections import deque
+from inspect import CO_COROUTINE
+from operator import attrgetter, itemgetter, mul
 from typing import Dict, List, Any, Optional, Callable
 from unittest.mock import AsyncMock, Mock
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 
-@dataclass
+@dataclass(slots=True)
 class MockOrder:
     """Mock order representation."""
     id: str
@@ -23,9 +26,24 @@ class MockOrder:
     filled_at: Optional[datetime] = None
     filled_quantity: float = 0.0
     remaining_quantity: float = 0.0
+    # ISO strings for created_at and filled_at, computed once
+    created_at_iso: str = ""
+    filled_at_iso: Optional[str] = None
 
+    def __post_init__(self):
+        if not self.created_at_iso:
+            self.created_at_iso = self.created_at.isoformat()
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Project the order into the dict returned by get_order."""
+        return dict(zip(_ORDER_KEYS, _order_values(self)))
+
+    def to_summary(self) -> Dict[str, Any]:
+        """Project the order into the shorter dict returned by get_orders."""
+        return dict(zip(_ORDER_SUMMARY_KEYS, _order_summary_values(self)))
+
+
+@dataclass(slots=True)
 class MockPosition:
     """Mock position representation."""
     symbol: str
@@ -36,6 +54,55 @@ class MockPosition:
     realized_pnl: float
     side: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Project the position into the dict returned by get_positions."""
+        return dict(zip(_POSITION_FIELDS, _position_values(self)))
+
+
+# Fields copied into serialized orders and positions, read with one
+# attrgetter call each; created_at is served from the cached ISO string
+_ORDER_SUMMARY_FIELDS = ("id", "symbol", "quantity", "side", "type", "price", "status")
+_ORDER_FIELDS = _ORDER_SUMMARY_FIELDS + ("filled_quantity", "remaining_quantity")
+_POSITION_FIELDS = ("symbol", "quantity", "avg_price", "current_price",
+                    "unrealized_pnl", "realized_pnl", "side")
+_ORDER_SUMMARY_KEYS = _ORDER_SUMMARY_FIELDS + ("created_at",)
+_ORDER_KEYS = _ORDER_FIELDS + ("created_at",)
+_order_values = attrgetter(*_ORDER_FIELDS, "created_at_iso")
+_order_summary_values = attrgetter(*_ORDER_SUMMARY_FIELDS, "created_at_iso")
+_position_values = attrgetter(*_POSITION_FIELDS)
+# Columns read from the position dicts passed to check_position_limits
+_position_quantity = itemgetter("quantity")
+_position_price = itemgetter("current_price")
+
+
+def _is_async_callback(callback: Callable) -> bool:
+    """Whether callback returns a coroutine that needs scheduling."""
+    code = getattr(callback, "__code__", None)
+    if code is None:
+        # Partials, AsyncMock and other callables without their own code
+        return asyncio.iscoroutinefunction(callback)
+    return bool(code.co_flags & CO_COROUTINE)
+
+
+# Order statuses that still count as active in get_stats
+_ACTIVE_STATES = frozenset({"pending", "partially_filled"})
+_ORDER_STATES = ("pending", "partially_filled", "filled", "cancelled")
+
+# Violation messages from RiskManagerMock.validate_order, formatted only
+# when an order is rejected
+_ORDER_VALUE_VIOLATION = "Order value ${:.2f} exceeds max position size ${}"
+_VIOLATION_COUNT_VIOLATION = "Too many risk violations ({})"
+_RISK_TOLERANCE_VIOLATION = "Order exceeds risk tolerance (${:.2f})"
+
+# Most entries kept in TradingEngineMock.order_history
+_ORDER_HISTORY_LIMIT = 10_000
+
+# Most orders the fill worker takes off its queue per execution delay
+_ORDER_BATCH_SIZE = 64
+
+# Longest stop() waits for the fill worker to drain before cancelling it
+_WORKER_STOP_TIMEOUT = 1.0
+
 
 class TradingEngineMock:
     """Mock trading engine for testing."""
@@ -43,42 +110,92 @@ class TradingEngineMock:
     def __init__(self):
         self.running = False
         self.orders = {}
+        # status -> {order id: order}, kept in step with self.orders
+        self.orders_by_status = {status: {} for status in _ORDER_STATES}
         self.positions = {}
-        self.order_history = []
+        self.order_history = deque(maxlen=_ORDER_HISTORY_LIMIT)
         self.execution_delay = 0.1
         self.fill_rate = 1.0  # 0.0-1.0
 
         # Callbacks
-        self.order_callbacks = {}
-        self.trade_callbacks = {}
+        self.order_callbacks = {}  # event -> (sync callbacks, async callbacks)
+        self.trade_callbacks = []
+        # Snapshots of trade_callbacks split by kind, rebuilt on registration
+        self._sync_trade_callbacks = ()
+        self._async_trade_callbacks = ()
+        # Background callback tasks that are still running
+        self._pending_tasks = set()
 
         # Statistics
         self.orders_placed = 0
         self.orders_filled = 0
         self.trades_executed = 0
+        self.active_orders = 0  # orders whose status is in _ACTIVE_STATES
+
+        # Order ids are unique per engine and distinct across engines
+        self._order_id_prefix = f"mock_order_{id(self):x}_"
+        self._next_order_number = itertools.count(1).__next__
+
+        # Placed orders wait here for the fill worker; None stops it. Both
+        # belong to the event loop the worker was started on.
+        self._order_queue: asyncio.Queue = asyncio.Queue()
+        self._order_worker_task: Optional[asyncio.Task] = None
 
     async def start(self) -> bool:
         """Mock start engine."""
-        await self._simulate_delay(0.1)
+        await asyncio.sleep(0.1)
         self.running = True
+        self._ensure_order_worker()
         return True
 
     async def stop(self) -> bool:
         """Mock stop engine."""
-        await self._simulate_delay(0.05)
+        await asyncio.sleep(0.05)
         self.running = False
+        task = self._order_worker_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            # The worker fills the orders queued ahead of the sentinel, then exits
+            self._order_queue.put_nowait(None)
+            await asyncio.wait((task,), timeout=_WORKER_STOP_TIMEOUT)
+        self._cancel_order_worker()
         return True
 
+    def _ensure_order_worker(self):
+        """Start the fill worker on the running loop unless it is already there.
+
+        A worker that has exited, or that belongs to another loop (an earlier
+        asyncio.run or per-test loop), is replaced by one on a fresh queue,
+        and every order still pending is queued again for it.
+        """
+        task = self._order_worker_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return
+
+        self._cancel_order_worker()
+        queue = self._order_queue = asyncio.Queue()
+        for order in self.orders_by_status["pending"].values():
+            queue.put_nowait(order)
+        self._order_worker_task = asyncio.create_task(self._order_worker())
+
+    def _cancel_order_worker(self):
+        """Cancel the fill worker, if any, and forget it."""
+        task = self._order_worker_task
+        self._order_worker_task = None
+        # A closed loop has already torn down its tasks
+        if task is not None and not task.done() and not task.get_loop().is_closed():
+            task.cancel()
+
     async def place_order(self, symbol: str, quantity: float, side: str,
                          order_type: str = "market", price: Optional[float] = None,
                          stop_price: Optional[float] = None) -> Dict[str, Any]:
         """Mock place order."""
-        await self._simulate_delay(self.execution_delay)
+        if (delay := self.execution_delay) > 0:
+            await asyncio.sleep(delay)
 
         if not self.running:
             raise Exception("Trading engine not running")
 
-        order_id = f"mock_order_{int(time.time() * 1000)}"
+        order_id = self._order_id_prefix + str(self._next_order_number())
 
         order = MockOrder(
             id=order_id,
@@ -92,19 +209,18 @@ class TradingEngineMock:
         )
         order.remaining_quantity = quantity
 
+        # Before indexing the order, so a replacement worker does not queue it twice
+        self._ensure_order_worker()
         self.orders[order_id] = order
+        self.orders_by_status["pending"][order_id] = order
         self.orders_placed += 1
+        self.active_orders += 1
 
         # Simulate order processing
-        asyncio.create_task(self._process_order(order))
+        self._order_queue.put_nowait(order)
 
         # Trigger callbacks
-        if "order_placed" in self.order_callbacks:
-            for callback in self.order_callbacks["order_placed"]:
-                if asyncio.iscoroutinefunction(callback):
-                    asyncio.create_task(callback(order))
-                else:
-                    callback(order)
+        self._dispatch_order_event("order_placed", order)
 
         return {
             "id": order_id,
@@ -116,105 +232,65 @@ class TradingEngineMock:
 
     async def cancel_order(self, order_id: str) -> bool:
         """Mock cancel order."""
-        await self._simulate_delay(0.05)
+        await asyncio.sleep(0.05)
 
         if order_id not in self.orders:
             return False
 
         order = self.orders[order_id]
-        if order.status in ["filled", "cancelled"]:
+        if order.status not in _ACTIVE_STATES:
             return False
 
-        order.status = "cancelled"
+        self._set_order_status(order, "cancelled")
+        self.active_orders -= 1
 
         # Trigger callbacks
-        if "order_cancelled" in self.order_callbacks:
-            for callback in self.order_callbacks["order_cancelled"]:
-                if asyncio.iscoroutinefunction(callback):
-                    asyncio.create_task(callback(order))
-                else:
-                    callback(order)
+        self._dispatch_order_event("order_cancelled", order)
 
         return True
 
     async def get_order(self, order_id: str) -> Optional[Dict[str, Any]]:
         """Mock get order."""
-        await self._simulate_delay(0.02)
+        await asyncio.sleep(0.02)
 
         if order_id not in self.orders:
             return None
 
-        order = self.orders[order_id]
-        return {
-            "id": order.id,
-            "symbol": order.symbol,
-            "quantity": order.quantity,
-            "side": order.side,
-            "type": order.type,
-            "price": order.price,
-            "status": order.status,
-            "filled_quantity": order.filled_quantity,
-            "remaining_quantity": order.remaining_quantity,
-            "created_at": order.created_at.isoformat()
-        }
+        return self.orders[order_id].to_dict()
 
     async def get_orders(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """Mock get orders."""
-        await self._simulate_delay(0.03)
-
-        orders = []
-        for order in self.orders.values():
-            if status is None or order.status == status:
-                orders.append({
-                    "id": order.id,
-                    "symbol": order.symbol,
-                    "quantity": order.quantity,
-                    "side": order.side,
-                    "type": order.type,
-                    "price": order.price,
-                    "status": order.status,
-                    "created_at": order.created_at.isoformat()
-                })
-
-        return orders
+        await asyncio.sleep(0.03)
+
+        orders = self.orders if status is None else self.orders_by_status.get(status, {})
+        return [order.to_summary() for order in orders.values()]
 
     async def get_positions(self) -> List[Dict[str, Any]]:
         """Mock get positions."""
-        await self._simulate_delay(0.02)
-
-        positions = []
-        for position in self.positions.values():
-            positions.append({
-                "symbol": position.symbol,
-                "quantity": position.quantity,
-                "avg_price": position.avg_price,
-                "current_price": position.current_price,
-                "unrealized_pnl": position.unrealized_pnl,
-                "realized_pnl": position.realized_pnl,
-                "side": position.side
-            })
-
-        return positions
+        await asyncio.sleep(0.02)
+
+        return [position.to_dict() for position in self.positions.values()]
 
     async def close_position(self, symbol: str) -> bool:
         """Mock close position."""
-        await self._simulate_delay(0.1)
+        await asyncio.sleep(0.1)
 
-        if symbol not in self.positions:
+        # Remove position, putting it back if the closing order fails
+        position = self.positions.pop(symbol, None)
+        if position is None:
             return False
 
-        position = self.positions[symbol]
-
         # Place opposite order to close position
-        await self.place_order(
-            symbol=symbol,
-            quantity=position.quantity,
-            side="sell" if position.side == "long" else "buy",
-            order_type="market"
-        )
-
-        # Remove position
-        del self.positions[symbol]
+        try:
+            await self.place_order(
+                symbol=symbol,
+                quantity=position.quantity,
+                side="sell" if position.side == "long" else "buy",
+                order_type="market"
+            )
+        except Exception:
+            self.positions[symbol] = position
+            raise
 
         return True
 
@@ -222,19 +298,90 @@ class TradingEngineMock:
     def add_order_callback(self, event: str, callback: Callable):
         """Add order event callback."""
         if event not in self.order_callbacks:
-            self.order_callbacks[event] = []
+            self.order_callbacks[event] = ([], [])
+
+        sync_callbacks, async_callbacks = self.order_callbacks[event]
+        if _is_async_callback(callback):
+            async_callbacks.append(callback)
+        else:
+            sync_callbacks.append(callback)
+
+    def _dispatch_order_event(self, event: str, *args):
+        """Call the sync callbacks for event and schedule the async ones."""
+        callbacks = self.order_callbacks.get(event)
+        if callbacks is None:
+            return
 
-        self.order_callbacks[event].append(callback)
+        sync_callbacks, async_callbacks = callbacks
+        for callback in sync_callbacks:
+            callback(*args)
+        if async_callbacks:
+            self._schedule_callbacks([callback(*args) for callback in async_callbacks])
+
+    def _schedule_callbacks(self, coros: List[Any]):
+        """Run async callback coroutines in the background as one task."""
+        task = asyncio.gather(*coros, return_exceptions=True)
+        # Hold a reference so the task is not collected before it finishes
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._callbacks_done)
+
+    def _callbacks_done(self, task: asyncio.Future):
+        """Release a finished callback task and report the callbacks that failed."""
+        self._pending_tasks.discard(task)
+        if task.cancelled():
+            return
+        for result in task.result():
+            if isinstance(result, Exception):
+                print(f"Error in trading callback: {result!r}")
 
     def add_trade_callback(self, callback: Callable):
         """Add trade execution callback."""
         self.trade_callbacks.append(callback)
+        if _is_async_callback(callback):
+            self._async_trade_callbacks += (callback,)
+        else:
+            self._sync_trade_callbacks += (callback,)
+
+    def _set_order_status(self, order: MockOrder, status: str):
+        """Change an order's status, moving it within orders_by_status."""
+        # Orders dropped by reset_stats are no longer indexed
+        if self.orders.get(order.id) is order:
+            by_status = self.orders_by_status
+            by_status[order.status].pop(order.id, None)
+            by_status.setdefault(status, {})[order.id] = order
+        order.status = status
 
     # Order processing simulation
+    async def _order_worker(self):
+        """Fill queued orders in batches, sleeping once per batch."""
+        queue = self._order_queue
+        stopping = False
+        while not stopping:
+            batch = [await queue.get()]
+            while len(batch) < _ORDER_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            stopping = any(order is None for order in batch)
+            orders = [order for order in batch if order is not None]
+            if orders and (delay := self.execution_delay) > 0:
+                await asyncio.sleep(delay)
+
+            for order in orders:
+                # A failing fill callback must not stop the orders behind it
+                try:
+                    await self._fill_order(order)
+                except Exception as e:
+                    print(f"Error filling order {order.id}: {e}")
+
     async def _process_order(self, order: MockOrder):
         """Simulate order processing."""
-        await self._simulate_delay(self.execution_delay)
+        if (delay := self.execution_delay) > 0:
+            await asyncio.sleep(delay)
+
+        await self._fill_order(order)
 
+    async def _fill_order(self, order: MockOrder):
+        """Fill an order whose execution delay has passed."""
         if order.status == "cancelled":
             return
 
@@ -242,8 +389,12 @@ class TradingEngineMock:
         fill_quantity = order.quantity * self.fill_rate
         order.filled_quantity = fill_quantity
         order.remaining_quantity = order.quantity - fill_quantity
-        order.status = "filled" if order.remaining_quantity == 0 else "partially_filled"
+        self._set_order_status(order, "filled" if order.remaining_quantity == 0 else "partially_filled")
         order.filled_at = datetime.now()
+        order.filled_at_iso = order.filled_at.isoformat()
+        # Orders dropped by reset_stats were already taken off the count
+        if order.status == "filled" and self.orders.get(order.id) is order:
+            self.active_orders -= 1
 
         self.orders_filled += 1
 
@@ -255,7 +406,7 @@ class TradingEngineMock:
             "quantity": fill_quantity,
             "price": order.price or 50000.00,  # Default price if not specified
             "side": order.side,
-            "timestamp": order.filled_at.isoformat()
+            "timestamp": order.filled_at_iso
         }
 
         # Update position if this is a filled order
@@ -263,19 +414,12 @@ class TradingEngineMock:
             await self._update_position(order, trade)
 
         # Trigger callbacks
-        if "order_filled" in self.order_callbacks:
-            for callback in self.order_callbacks["order_filled"]:
-                if asyncio.iscoroutinefunction(callback):
-                    asyncio.create_task(callback(order, trade))
-                else:
-                    callback(order, trade)
+        self._dispatch_order_event("order_filled", order, trade)
 
-        if self.trade_callbacks:
-            for callback in self.trade_callbacks:
-                if asyncio.iscoroutinefunction(callback):
-                    asyncio.create_task(callback(trade))
-                else:
-                    callback(trade)
+        for callback in self._sync_trade_callbacks:
+            callback(trade)
+        if self._async_trade_callbacks:
+            self._schedule_callbacks([callback(trade) for callback in self._async_trade_callbacks])
 
     async def _update_position(self, order: MockOrder, trade: Dict[str, Any]):
         """Update position based on filled order."""
@@ -283,8 +427,9 @@ class TradingEngineMock:
         quantity = trade["quantity"]
         price = trade["price"]
 
-        if symbol not in self.positions:
-            self.positions[symbol] = MockPosition(
+        position = self.positions.get(symbol)
+        if position is None:
+            position = MockPosition(
                 symbol=symbol,
                 quantity=0.0,
                 avg_price=0.0,
@@ -293,8 +438,7 @@ class TradingEngineMock:
                 realized_pnl=0.0,
                 side=order.side
             )
-
-        position = self.positions[symbol]
+            self.positions[symbol] = position
 
         if order.side == "buy":
             # Update average price for long position
@@ -322,14 +466,19 @@ class TradingEngineMock:
 
     def set_fill_rate(self, rate: float):
         """Set order fill rate (0.0-1.0)."""
-        self.fill_rate = max(0.0, min(1.0, rate))
+        self.fill_rate = 0.0 if rate < 0.0 else 1.0 if rate > 1.0 else rate
 
     def reset_stats(self):
         """Reset engine statistics."""
+        # The next start or place_order brings up a worker on a fresh queue
+        self._cancel_order_worker()
         self.orders_placed = 0
         self.orders_filled = 0
         self.trades_executed = 0
+        self.active_orders = 0
         self.orders.clear()
+        for orders in self.orders_by_status.values():
+            orders.clear()
         self.positions.clear()
         self.order_history.clear()
 
@@ -340,22 +489,17 @@ class TradingEngineMock:
             "orders_placed": self.orders_placed,
             "orders_filled": self.orders_filled,
             "trades_executed": self.trades_executed,
-            "active_orders": len([o for o in self.orders.values() if o.status in ["pending", "partially_filled"]]),
+            "active_orders": self.active_orders,
             "positions": len(self.positions)
         }
 
-    async def _simulate_delay(self, seconds: float):
-        """Simulate delay."""
-        if seconds > 0:
-            await asyncio.sleep(seconds)
-
 
 class RiskManagerMock:
     """Mock risk manager for testing."""
 
     def __init__(self):
         self.risk_checks_enabled = True
-        self.max_position_size = 1000.0
+        self._max_position_size = 1000.0
         self.max_positions = 5
         self.risk_tolerance = 0.02
         self.stop_loss_percentage = 0.05
@@ -366,30 +510,82 @@ class RiskManagerMock:
         self.approved_orders = 0
         self.rejected_orders = 0
 
+    # The derived thresholds are refreshed whenever a setting is assigned
+    @property
+    def max_position_size(self) -> float:
+        return self._max_position_size
+
+    @max_position_size.setter
+    def max_position_size(self, size: float):
+        self._max_position_size = size
+        self._max_exposure = self._max_positions * size
+
+    @property
+    def max_positions(self) -> int:
+        return self._max_positions
+
+    @max_positions.setter
+    def max_positions(self, count: int):
+        self._max_positions = count
+        self._max_exposure = count * self._max_position_size
+
+    @property
+    def risk_tolerance(self) -> float:
+        return self._risk_tolerance
+
+    @risk_tolerance.setter
+    def risk_tolerance(self, tolerance: float):
+        self._risk_tolerance = tolerance
+        self._risk_tolerance_threshold = 10000 * tolerance
+
+    @property
+    def stop_loss_percentage(self) -> float:
+        return self._stop_loss_percentage
+
+    @stop_loss_percentage.setter
+    def stop_loss_percentage(self, percentage: float):
+        self._stop_loss_percentage = percentage
+        self._stop_loss_mult = 1 - percentage
+
+    @property
+    def take_profit_percentage(self) -> float:
+        return self._take_profit_percentage
+
+    @take_profit_percentage.setter
+    def take_profit_percentage(self, percentage: float):
+        self._take_profit_percentage = percentage
+        self._take_profit_mult = 1 + percentage
+
     async def validate_order(self, symbol: str, quantity: float, side: str,
                            price: Optional[float] = None) -> Dict[str, Any]:
         """Mock validate order against risk rules."""
-        await self._simulate_delay(0.02)
+        await asyncio.sleep(0.02)
 
         if not self.risk_checks_enabled:
             return {"approved": True, "reason": "Risk checks disabled"}
 
-        violations = []
+        # (template, *args) pairs, formatted only if the order is rejected;
+        # the list itself is only created once a check fails
+        violations = None
 
         # Check position size limit
         estimated_value = quantity * (price or 50000.00)
-        if estimated_value > self.max_position_size:
-            violations.append(f"Order value ${estimated_value:.2f} exceeds max position size ${self.max_position_size}")
+        if estimated_value > self._max_position_size:
+            violations = [(_ORDER_VALUE_VIOLATION, estimated_value, self._max_position_size)]
 
         # Check max positions (simplified check)
-        if len(self.risk_violations) > self.max_positions:
-            violations.append(f"Too many risk violations ({len(self.risk_violations)})")
+        if len(self.risk_violations) > self._max_positions:
+            violations = violations or []
+            violations.append((_VIOLATION_COUNT_VIOLATION, len(self.risk_violations)))
 
         # Check risk tolerance (simplified)
-        if estimated_value > 10000 * self.risk_tolerance:
-            violations.append(f"Order exceeds risk tolerance (${10000 * self.risk_tolerance:.2f})")
+        threshold = self._risk_tolerance_threshold
+        if estimated_value > threshold:
+            violations = violations or []
+            violations.append((_RISK_TOLERANCE_VIOLATION, threshold))
 
         if violations:
+            violations = [template.format(*args) for template, *args in violations]
             self.risk_violations.extend(violations)
             self.rejected_orders += 1
             return {
@@ -401,47 +597,51 @@ class RiskManagerMock:
         return {
             "approved": True,
             "reason": "Order approved",
-            "stop_loss": price * (1 - self.stop_loss_percentage) if price else None,
-            "take_profit": price * (1 + self.take_profit_percentage) if price else None
+            "stop_loss": price * self._stop_loss_mult if price else None,
+            "take_profit": price * self._take_profit_mult if price else None
         }
 
     async def check_position_limits(self, positions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Mock check position limits."""
-        await self._simulate_delay(0.01)
+        await asyncio.sleep(0.01)
 
-        violations = []
-        total_exposure = 0.0
+        values = list(map(mul, map(_position_quantity, positions),
+                          map(_position_price, positions)))
+        total_exposure = sum(values, 0.0)
+        max_exposure = self._max_exposure
 
-        for position in positions:
-            position_value = position["quantity"] * position["current_price"]
-            total_exposure += position_value
+        # Only positions over the limit need formatting
+        max_size = self._max_position_size
+        violations = [
+            f"Position {position['symbol']} value ${value:.2f} exceeds limit"
+            for position, value in zip(positions, values) if value > max_size
+        ]
 
-            if position_value > self.max_position_size:
-                violations.append(f"Position {position['symbol']} value ${position_value:.2f} exceeds limit")
-
-        if total_exposure > self.max_positions * self.max_position_size:
+        if total_exposure > max_exposure:
             violations.append(f"Total exposure ${total_exposure:.2f} exceeds limits")
 
         return {
-            "within_limits": len(violations) == 0,
+            "within_limits": not violations,
             "violations": violations,
             "total_exposure": total_exposure,
-            "max_exposure": self.max_positions * self.max_position_size
+            "max_exposure": max_exposure
         }
 
     async def calculate_position_risk(self, symbol: str, quantity: float,
                                     current_price: float) -> float:
         """Mock calculate position risk."""
-        await self._simulate_delay(0.01)
+        await asyncio.sleep(0.01)
 
         position_value = quantity * current_price
-        risk_score = min(position_value / 10000.0, 1.0)  # Normalize to 0-1
+        risk_score = position_value / 10000.0  # Normalize to 0-1
+        if risk_score > 1.0:
+            risk_score = 1.0
 
         return risk_score * self.risk_tolerance
 
     async def get_risk_summary(self) -> Dict[str, Any]:
         """Mock get risk summary."""
-        await self._simulate_delay(0.02)
+        await asyncio.sleep(0.02)
 
         return {
             "risk_checks_enabled": self.risk_checks_enabled,
@@ -462,6 +662,10 @@ class RiskManagerMock:
         """Set max position size."""
         self.max_position_size = size
 
+    def set_max_positions(self, count: int):
+        """Set max number of positions."""
+        self.max_positions = count
+
     def set_risk_tolerance(self, tolerance: float):
         """Set risk tolerance."""
         self.risk_tolerance = tolerance
@@ -476,11 +680,6 @@ class RiskManagerMock:
         self.rejected_orders = 0
         self.risk_violations.clear()
 
-    async def _simulate_delay(self, seconds: float):
-        """Simulate delay."""
-        if seconds > 0:
-            await asyncio.sleep(seconds)
-
 
 class TradingMockBuilder:
     """Builder for creating customized trading mocks."""
@@ -4,11 +4,26 @@ Mock implementation for WebSocket client.
 import asyncio
 import json
 import time
+from collections import deque
 from typing import Any, Dict, List, Optional, Callable, AsyncGenerator
 from unittest.mock import Mock, AsyncMock
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # listed in requirements.txt; to_json falls back to the stdlib encoder
+    orjson = None
+
+
+# Pause after a failed receive in _process_messages, doubled on each
+# consecutive failure up to the cap
+_ERROR_BACKOFF_INITIAL = 0.1
+_ERROR_BACKOFF_MAX = 1.0
+
+# Default number of sent and received messages WebSocketMock keeps
+_DEFAULT_HISTORY_LIMIT = 10_000
+
 
 class WebSocketState(Enum):
     """WebSocket connection states."""
@@ -19,7 +34,7 @@ class WebSocketState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class MockWebSocketMessage:
     """Represents a WebSocket message."""
     data: Any
@@ -40,21 +55,30 @@ class MockWebSocketMessage:
 
     def to_json(self) -> str:
         """Convert message to JSON string."""
-        return json.dumps(self.to_dict())
+        data = self.to_dict()
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                pass  # payloads orjson rejects, e.g. ints beyond 64 bits
+        return json.dumps(data)
 
 
 class WebSocketMock:
     """Comprehensive mock for WebSocket client."""
 
-    def __init__(self):
+    def __init__(self, history_limit: int = _DEFAULT_HISTORY_LIMIT):
         self.state = WebSocketState.DISCONNECTED
         self.connected = False
         self.url = None
 
         # Message handling
-        self.sent_messages = []
-        self.received_messages = []
-        self.message_handlers = {}
+        # Only the most recent history_limit messages are kept
+        self.history_limit = history_limit
+        self.sent_messages = deque(maxlen=history_limit)
+        self.received_messages = deque(maxlen=history_limit)
+        self.message_handlers = {}  # message type -> [(handler, is_coroutine)]
+        self._active_handler_count = 0
 
         # Connection control
         self.auto_connect = True
@@ -141,16 +165,14 @@ class WebSocketMock:
 
         try:
             # Wait for message from queue with timeout
-            message = await asyncio.wait_for(
-                self.message_queue.get(),
-                timeout=1.0
-            )
+            async with asyncio.timeout(1.0):
+                message = await self.message_queue.get()
             self.received_messages.append(message)
             self.messages_received += 1
 
             return message
 
-        except asyncio.TimeoutError:
+        except TimeoutError:
             # Return a heartbeat message if no messages
             heartbeat = MockWebSocketMessage(
                 data={"type": "heartbeat"},
@@ -186,8 +208,11 @@ class WebSocketMock:
 
     def queue_messages(self, messages: List[Dict[str, Any]]):
         """Add multiple messages to the incoming message queue."""
+        # One timestamp for the whole batch
+        now = time.time()
+        put = self.message_queue.put_nowait
         for message_data in messages:
-            self.queue_json_message(message_data)
+            put(MockWebSocketMessage(data=message_data, message_type="json", timestamp=now))
 
     async def clear_message_queue(self):
         """Clear all queued messages."""
@@ -203,19 +228,25 @@ class WebSocketMock:
         if message_type not in self.message_handlers:
             self.message_handlers[message_type] = []
 
-        self.message_handlers[message_type].append(handler)
+        self.message_handlers[message_type].append(
+            (handler, asyncio.iscoroutinefunction(handler))
+        )
+        self._active_handler_count += 1
 
     def remove_message_handler(self, message_type: str, handler: Callable):
         """Remove handler for specific message types."""
-        if message_type in self.message_handlers:
-            try:
-                self.message_handlers[message_type].remove(handler)
-            except ValueError:
-                pass
+        handlers = self.message_handlers.get(message_type)
+        if handlers:
+            for index, (registered, _) in enumerate(handlers):
+                if registered == handler:
+                    del handlers[index]
+                    self._active_handler_count -= 1
+                    break
 
     # Message processing
     async def _process_messages(self):
         """Process incoming messages and trigger handlers."""
+        error_backoff = _ERROR_BACKOFF_INITIAL
         while self.connected:
             try:
                 # Wait for message
@@ -224,22 +255,23 @@ class WebSocketMock:
                 # Trigger handlers
                 message_type = message.message_type
                 if message_type in self.message_handlers:
-                    for handler in self.message_handlers[message_type]:
+                    for handler, is_coroutine in self.message_handlers[message_type]:
                         try:
-                            if asyncio.iscoroutinefunction(handler):
+                            if is_coroutine:
                                 await handler(message)
                             else:
                                 handler(message)
                         except Exception as e:
                             print(f"Error in message handler: {e}")
 
-                await asyncio.sleep(0.01)  # Small delay between processing
+                error_backoff = _ERROR_BACKOFF_INITIAL
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 print(f"Error processing messages: {e}")
-                await asyncio.sleep(0.1)
+                await asyncio.sleep(error_backoff)
+                error_backoff = min(error_backoff * 2, _ERROR_BACKOFF_MAX)
 
     # Simulation methods
     def simulate_disconnect(self):
@@ -291,16 +323,16 @@ class WebSocketMock:
             "messages_sent": self.messages_sent,
             "messages_received": self.messages_received,
             "queued_messages": self.message_queue.qsize(),
-            "active_handlers": sum(len(handlers) for handlers in self.message_handlers.values())
+            "active_handlers": self._active_handler_count
         }
 
     def get_sent_messages(self) -> List[MockWebSocketMessage]:
         """Get all sent messages."""
-        return self.sent_messages.copy()
+        return list(self.sent_messages)
 
     def get_received_messages(self) -> List[MockWebSocketMessage]:
         """Get all received messages."""
-        return self.received_messages.copy()
+        return list(self.received_messages)
 
     def reset_stats(self):
         """Reset statistics."""
@@ -326,7 +358,8 @@ class WebSocketMockBuilder:
             "auto_connect": True,
             "error_on_connect": False,
             "initial_messages": [],
-            "message_handlers": {}
+            "message_handlers": {},
+            "history_limit": _DEFAULT_HISTORY_LIMIT
         }
 
     def with_connection_delay(self, delay: float) -> 'WebSocketMockBuilder':
@@ -354,6 +387,11 @@ class WebSocketMockBuilder:
         self.config["initial_messages"] = messages
         return self
 
+    def with_history_limit(self, limit: int) -> 'WebSocketMockBuilder':
+        """Configure how many sent and received messages are kept."""
+        self.config["history_limit"] = limit
+        return self
+
     def with_message_handler(self, message_type: str, handler: Callable) -> 'WebSocketMockBuilder':
         """Add message handler."""
         if message_type not in self.config["message_handlers"]:
@@ -364,7 +402,7 @@ class WebSocketMockBuilder:
 
     def build(self) -> WebSocketMock:
         """Build the configured WebSocket mock."""
-        mock = WebSocketMock()
+        mock = WebSocketMock(history_limit=self.config["history_limit"])
 
         # Apply configuration
         mock.set_connection_delay(self.config["connection_delay"])
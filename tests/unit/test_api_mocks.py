@@ -0,0 +1,285 @@
+"""
+Unit tests for the Robinhood API mocks.
+"""
+import dataclasses
+import gc
+import json
+import pytest
+import weakref
+from types import MappingProxyType
+
+from tests.mocks.api_mocks import (
+    MockApiClientBuilder, MockNotAuthenticated, MockNotFound, MockQuote, MockScenarioBuilder,
+    QuoteNotFound, RobinhoodApiMock
+)
+
+
+class TestRobinhoodApiMockGetters:
+    """Test cases for how RobinhoodApiMock getters hand out stored records."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.api_mock = RobinhoodApiMock()
+
+    async def test_getters_return_json_serializable_copies(self):
+        """Getters return plain dicts that can be serialized and mutated safely."""
+        await self.api_mock.authenticate("user", "password")
+        order = await self.api_mock.place_order(symbol="BTC", quantity="1", side="buy")
+
+        responses = [
+            await self.api_mock.get_account_info(),
+            await self.api_mock.get_quote("BTC"),
+            await self.api_mock.get_quotes(["BTC", "XRP"]),
+            await self.api_mock.get_positions(),
+            await self.api_mock.get_orders(),
+            await self.api_mock.get_crypto_positions(),
+            await self.api_mock.get_crypto_quotes(["BTC", "XRP"]),
+        ]
+        for response in responses:
+            json.dumps(response)
+
+        listed = (await self.api_mock.get_orders())[0]
+        listed["status"] = "tampered"
+        assert (await self.api_mock.get_order(order["id"]))["status"] == "placed"
+
+    async def test_return_frozen_applies_to_every_getter(self):
+        """With RETURN_FROZEN set, single and bulk getters return read-only views."""
+        self.api_mock.RETURN_FROZEN = True
+
+        quote = await self.api_mock.get_quote("BTC")
+        positions = await self.api_mock.get_positions()
+        quotes = await self.api_mock.get_quotes(["BTC", "XRP"])
+
+        assert isinstance(quote, MappingProxyType)
+        assert all(isinstance(position, MappingProxyType) for position in positions)
+        assert all(isinstance(entry, MappingProxyType) for entry in quotes.values())
+        with pytest.raises(TypeError):
+            quote["ask_price"] = "0"
+
+
+class TestRobinhoodApiMockSeededData:
+    """Test cases for records written straight into the mock's stores."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.api_mock = RobinhoodApiMock()
+
+    async def test_seeded_records_are_served(self):
+        """Quotes and positions added to the stores directly are returned by the getters."""
+        self.api_mock._quotes["XRP"] = {"symbol": "XRP", "last_trade_price": "0.50"}
+        self.api_mock._positions["XRP"] = {"symbol": "XRP", "quantity": "10"}
+        self.api_mock._crypto_quotes["DOGE"] = {"symbol": "DOGE", "last_trade_price": "0.10"}
+
+        assert (await self.api_mock.get_quote("XRP"))["last_trade_price"] == "0.50"
+        assert (await self.api_mock.get_quotes(["XRP"]))["XRP"]["last_trade_price"] == "0.50"
+        assert (await self.api_mock.get_position("XRP"))["quantity"] == "10"
+        assert (await self.api_mock.get_crypto_quote("DOGE"))["last_trade_price"] == "0.10"
+
+    async def test_replaced_records_are_served(self):
+        """Replacing a stored quote is visible through both serving policies."""
+        self.api_mock._quotes["BTC"] = {"symbol": "BTC", "last_trade_price": "1.00"}
+
+        assert (await self.api_mock.get_quote("BTC"))["last_trade_price"] == "1.00"
+        self.api_mock.RETURN_FROZEN = True
+        assert (await self.api_mock.get_quote("BTC"))["last_trade_price"] == "1.00"
+
+    async def test_missing_records_raise_not_found(self):
+        """Lookups for unknown keys raise the mock's not-found errors, not KeyError."""
+        with pytest.raises(QuoteNotFound):
+            await self.api_mock.get_quote("XRP")
+        with pytest.raises(QuoteNotFound):
+            await self.api_mock.get_crypto_quote("XRP")
+        with pytest.raises(MockNotFound):
+            await self.api_mock.get_position("XRP")
+
+
+class TestRobinhoodApiMockCryptoPositions:
+    """Test cases for filtering crypto positions."""
+
+    async def test_filtered_positions_keep_storage_order(self):
+        """Positions come back in storage order, whatever order the codes are requested in."""
+        api_mock = RobinhoodApiMock()
+        api_mock.add_crypto_position("ETH", "2", "3000.00")
+        api_mock.add_crypto_position("SOL", "5", "100.00")
+        stored = [p["asset_code"] for p in (await api_mock.get_crypto_positions())["results"]]
+
+        requested = list(reversed(stored)) + ["XRP", stored[0]]
+        result = await api_mock.get_crypto_positions(asset_codes=requested)
+
+        assert [p["asset_code"] for p in result["results"]] == stored
+
+
+class TestRobinhoodApiMockOrders:
+    """Test cases for the order status index."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.api_mock = RobinhoodApiMock()
+
+    async def test_mutating_a_placed_order_leaves_the_index_intact(self):
+        """place_order returns a copy, so editing it cannot desync get_orders."""
+        await self.api_mock.authenticate("user", "password")
+        order = await self.api_mock.place_order(symbol="BTC", quantity="1", side="buy")
+
+        order["status"] = "filled"
+
+        assert [o["id"] for o in await self.api_mock.get_orders(status="placed")] == [order["id"]]
+        assert await self.api_mock.get_orders(status="filled") == []
+        assert (await self.api_mock.get_order(order["id"]))["status"] == "placed"
+
+    async def test_cancel_order_moves_the_id_out_of_every_bucket(self):
+        """A cancelled order is listed only as cancelled, even if its status was edited in place."""
+        await self.api_mock.authenticate("user", "password")
+        order = await self.api_mock.place_order(symbol="BTC", quantity="1", side="buy")
+        self.api_mock._orders[order["id"]]["status"] = "filled"
+
+        assert await self.api_mock.cancel_order(order["id"])
+
+        assert await self.api_mock.get_orders(status="placed") == []
+        assert await self.api_mock.get_orders(status="filled") == []
+        assert [o["id"] for o in await self.api_mock.get_orders(status="cancelled")] == [order["id"]]
+
+
+class TestRobinhoodApiMockRecords:
+    """Test cases for typed quote records and lazy iterators."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.api_mock = RobinhoodApiMock()
+
+    def test_get_quote_record_matches_stored_quote(self):
+        """get_quote_record returns an immutable MockQuote built from the quote."""
+        record = self.api_mock.get_quote_record("BTC")
+
+        assert isinstance(record, MockQuote)
+        assert record.symbol == "BTC"
+        assert record.last_trade_price == "50000.00"
+        assert self.api_mock.get_quote_record("BTC") is record
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.ask_price = "0"
+
+    def test_get_quote_record_follows_price_updates(self):
+        """A price change replaces the cached record without altering the old one."""
+        old = self.api_mock.get_quote_record("BTC")
+        self.api_mock.set_quote_price("BTC", 60000.0)
+        new = self.api_mock.get_quote_record("BTC")
+
+        assert new is not old
+        assert new.last_trade_price == "60000.0"
+        assert old.last_trade_price == "50000.00"
+
+    async def test_iter_orders_filters_by_status(self):
+        """iter_orders yields read-only views, optionally by status."""
+        await self.api_mock.authenticate("user", "password")
+        first = await self.api_mock.place_order(symbol="BTC", quantity="1", side="buy")
+        second = await self.api_mock.place_order(symbol="ETH", quantity="2", side="sell")
+        await self.api_mock.cancel_order(first["id"])
+
+        assert [order["id"] for order in self.api_mock.iter_orders()] == [first["id"], second["id"]]
+        assert [order["id"] for order in self.api_mock.iter_orders("placed")] == [second["id"]]
+        assert [order["id"] for order in self.api_mock.iter_orders("cancelled")] == [first["id"]]
+        assert list(self.api_mock.iter_orders("filled")) == []
+        with pytest.raises(TypeError):
+            next(self.api_mock.iter_orders())["status"] = "filled"
+
+    def test_iter_positions_reflects_added_positions(self):
+        """iter_positions yields read-only views of the current positions."""
+        self.api_mock.add_position("ETH", "2", "2500.00")
+
+        positions = {position["symbol"]: position for position in self.api_mock.iter_positions()}
+
+        assert set(positions) == {"BTC", "ETH"}
+        assert positions["ETH"]["quantity"] == "2"
+        assert positions["ETH"]["current_price"] == "3000.00"
+        with pytest.raises(TypeError):
+            positions["ETH"]["quantity"] = "3"
+
+        self.api_mock.clear_positions()
+        assert list(self.api_mock.iter_positions()) == []
+
+
+class _Marker:
+    """Weak-referenceable stand-in for test state held by a raising frame."""
+
+
+class TestRobinhoodApiMockErrors:
+    """Test cases for exceptions raised by RobinhoodApiMock."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.api_mock = RobinhoodApiMock()
+
+    async def test_not_found_raises_fresh_exceptions(self):
+        """Each miss raises a new exception carrying the cached message."""
+        with pytest.raises(QuoteNotFound) as first:
+            await self.api_mock.get_quote("XRP")
+        with pytest.raises(QuoteNotFound) as second:
+            await self.api_mock.get_quote("XRP")
+
+        assert first.value is not second.value
+        assert str(first.value) == str(second.value) == "Quote not found for XRP"
+
+    async def test_raised_exceptions_do_not_pin_caller_frames(self):
+        """Once handled, a raised exception keeps no reference to the raising frame."""
+        async def lookup_missing():
+            marker = _Marker()
+            try:
+                await self.api_mock.get_quote("XRP")
+            except QuoteNotFound:
+                pass
+            return weakref.ref(marker)
+
+        ref = await lookup_missing()
+        gc.collect()
+        assert ref() is None
+
+    async def test_unauthenticated_calls_raise_mock_not_authenticated(self):
+        """Calls that need authentication raise a fresh MockNotAuthenticated."""
+        with pytest.raises(MockNotAuthenticated) as first:
+            await self.api_mock.get_account_info()
+        with pytest.raises(MockNotAuthenticated) as second:
+            await self.api_mock.get_account_info()
+
+        assert first.value is not second.value
+
+
+class TestMockApiClientBuilder:
+    """Test cases for MockApiClientBuilder."""
+
+    async def test_built_mocks_are_independent(self):
+        """Each build starts from fresh default data and its own random source."""
+        builder = MockApiClientBuilder()
+        first = builder.build()
+        second = builder.build()
+
+        first.set_quote_price("BTC", 1.0)
+
+        assert (await second.get_quote("BTC"))["last_trade_price"] == "50000.00"
+        assert first._rng is not second._rng
+
+
+class TestScenarioMock:
+    """Test cases for ScenarioMock response steps."""
+
+    async def test_first_matching_response_step_wins(self):
+        """Exact and substring matches both return the first step that matches."""
+        scenario = (MockScenarioBuilder()
+                    .add_response_step("/quotes", {"source": "quotes"})
+                    .add_response_step("/quotes/BTC", {"source": "btc"})
+                    .build_scenario())
+
+        assert await scenario.execute_request("GET", "/quotes") == {"source": "quotes"}
+        assert await scenario.execute_request("GET", "/quotes/BTC") == {"source": "quotes"}
+        assert await scenario.execute_request("GET", "/v1/quotes/ETH") == {"source": "quotes"}
+
+    async def test_steps_are_frozen_when_built(self):
+        """Steps added to the builder later do not affect an existing scenario."""
+        builder = MockScenarioBuilder().add_response_step("/orders", {"source": "orders"})
+        scenario = builder.build_scenario()
+
+        builder.add_response_step("/accounts", {"source": "accounts"})
+
+        assert len(scenario.steps) == 1
+        with pytest.raises(AttributeError):
+            scenario.steps.append({"type": "response", "config": {}})
+        assert await builder.build_scenario().execute_request("GET", "/accounts") == {"source": "accounts"}
@@ -0,0 +1,260 @@
+"""
+Unit tests for the Redis mocks.
+"""
+import asyncio
+import inspect
+import time
+import pytest
+
+from tests.mocks.redis_mock import RedisMock, RedisMockBuilder, RedisMockSync
+
+
+class TestRedisMockExpiry:
+    """Test cases for RedisMock key expiry."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.redis = RedisMock()
+
+    async def test_refreshed_ttl_keeps_expiry_heap_bounded(self):
+        """Repeatedly refreshing one key's TTL does not grow the expiry heap."""
+        await self.redis.set("session", "value")
+        for _ in range(1000):
+            await self.redis.expire("session", 60)
+
+        assert len(self.redis._expiry_heap) <= 2 * len(self.redis.expirations)
+        assert 59 <= await self.redis.ttl("session") <= 60
+
+    async def test_expired_key_is_evicted_after_refresh(self):
+        """The latest deadline wins after the heap has been rebuilt."""
+        await self.redis.set("session", "value", ex=60)
+        for _ in range(10):
+            await self.redis.expire("session", 60)
+        await self.redis.set("session", "value", px=10)
+        await asyncio.sleep(0.02)
+
+        assert await self.redis.get("session") is None
+
+
+class TestRedisMockSync:
+    """Test cases for the synchronous RedisMockSync."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.redis = RedisMockSync()
+
+    def test_commands_run_without_an_event_loop(self):
+        """Commands return results directly instead of coroutines."""
+        assert self.redis.set("key", 1) is True
+        assert self.redis.get("key") == "1"
+        assert self.redis.hset("hash", "field", "value") == 1
+        assert self.redis.hgetall("hash") == {"field": "value"}
+        assert self.redis.rpush("list", "a", "b") == 2
+        assert self.redis.lrange("list", 0, -1) == ["a", "b"]
+        assert self.redis.get_operation_count() == 6
+
+    def test_commands_match_the_async_mock(self):
+        """RedisMockSync exposes the same public commands as RedisMock."""
+        def commands(cls):
+            return {name for name in dir(cls) if not name.startswith("_") and callable(getattr(cls, name))}
+
+        assert commands(RedisMockSync) == commands(RedisMock)
+        assert not inspect.iscoroutinefunction(RedisMockSync.get)
+        assert inspect.iscoroutinefunction(RedisMock.get)
+
+    def test_delay_blocks_each_command(self):
+        """A configured delay is applied with a blocking sleep."""
+        self.redis.set_delay(0.02)
+        started = time.monotonic()
+        self.redis.set("key", "value")
+        assert time.monotonic() - started >= 0.02
+
+    def test_builder_builds_sync_mock(self):
+        """RedisMockBuilder.with_sync builds a prepopulated RedisMockSync."""
+        redis = RedisMockBuilder().with_sync().with_data("key", 5).build()
+
+        assert isinstance(redis, RedisMockSync)
+        assert redis.get("key") == "5"
+
+
+class TestRedisMockPipeline:
+    """Test cases for RedisMock and RedisMockSync pipelines."""
+
+    async def test_results_come_back_in_queue_order(self):
+        """execute() returns one result per queued command, in order."""
+        redis = RedisMock()
+        pipe = redis.pipeline()
+        pipe.set("key", "value").get("key").rpush("list", "a", "b").lrange("list", 0, -1)
+
+        assert len(pipe) == 4
+        assert await pipe.execute() == [True, "value", 2, ["a", "b"]]
+        assert len(pipe) == 0
+        assert redis.get_operation_count() == 4
+
+    async def test_execute_sleeps_once_per_batch(self, monkeypatch):
+        """A pipeline awaits the configured delay once, not once per command."""
+        redis = RedisMock()
+        redis.set_delay(0.01)
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        async with redis.pipeline() as pipe:
+            for i in range(5):
+                pipe.set(f"key{i}", i)
+            await pipe.execute()
+
+        assert sleeps == [0.01]
+
+    async def test_failing_command_does_not_drop_later_results(self):
+        """Commands after a failing one still run; the first error is raised."""
+        redis = RedisMock()
+        pipe = redis.pipeline()
+        pipe.set("before", 1).get().set("after", 2)
+
+        with pytest.raises(TypeError):
+            await pipe.execute()
+        assert await redis.get("after") == "2"
+
+        pipe.set("again", 3).get().get("again")
+        results = await pipe.execute(raise_on_error=False)
+        assert results[0] is True
+        assert isinstance(results[1], TypeError)
+        assert results[2] == "3"
+
+    def test_sync_pipeline(self, monkeypatch):
+        """RedisMockSync pipelines run synchronously with a single sleep."""
+        redis = RedisMockSync()
+        redis.set_delay(0.01)
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+
+        with redis.pipeline() as pipe:
+            pipe.hset("hash", "field", "value").hget("hash", "field")
+            assert pipe.execute() == [1, "value"]
+
+        assert sleeps == [0.01]
+
+    def test_unknown_command_is_rejected(self):
+        """Only mock commands can be queued."""
+        with pytest.raises(AttributeError):
+            RedisMock().pipeline().not_a_command
+
+
+class TestRedisMockCollections:
+    """Test cases for RedisMock hash, list and sorted set reads."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.redis = RedisMock()
+
+    async def test_hget_reads_the_hash_store(self):
+        """hget and hgetall see fields written by hset."""
+        await self.redis.hset("hash", "field", 42)
+
+        assert await self.redis.hget("hash", "field") == "42"
+        assert await self.redis.hget("hash", "other") is None
+        assert await self.redis.hgetall("hash") == {"field": "42"}
+
+    async def test_hash_read_miss_leaves_no_empty_hash(self):
+        """Reading a missing hash does not create it."""
+        assert await self.redis.hget("missing", "field") is None
+        assert await self.redis.hgetall("missing") == {}
+        assert self.redis.get_stats()["hashes"] == 0
+
+    async def test_lrange_to_minus_one_returns_whole_list(self):
+        """lrange(key, 0, -1) returns every element, as LRANGE does."""
+        await self.redis.rpush("list", "b", "c")
+        await self.redis.lpush("list", "a")
+
+        assert await self.redis.lrange("list", 0, -1) == ["a", "b", "c"]
+        assert await self.redis.lrange("list", -2, -1) == ["b", "c"]
+        assert await self.redis.lrange("list", 1, 1) == ["b"]
+        assert await self.redis.lrange("list", 2, 1) == []
+
+    async def test_zrange_orders_members_by_score(self):
+        """zrange returns members lowest score first, regardless of insert order."""
+        await self.redis.zadd("board", 3.0, "carol")
+        await self.redis.zadd("board", 1.0, "alice")
+        await self.redis.zadd("board", 2.0, "bob")
+
+        assert await self.redis.zrange("board", 0, -1) == ["alice", "bob", "carol"]
+        assert await self.redis.zrange("board", -2, -1, withscores=True) == [("bob", 2.0), ("carol", 3.0)]
+
+    async def test_zadd_rescores_existing_member(self):
+        """Re-adding a member moves it to its new rank."""
+        await self.redis.zadd("board", 1.0, "alice")
+        await self.redis.zadd("board", 2.0, "bob")
+        await self.redis.zadd("board", 3.0, "alice")
+        await self.redis.zrem("board", "missing")
+
+        assert await self.redis.zrange("board", 0, -1) == ["bob", "alice"]
+        assert await self.redis.zcard("board") == 2
+
+
+class TestRedisMockPooling:
+    """Test cases for releasing and reusing mocks through RedisMockBuilder."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        RedisMock._pool.clear()
+        RedisMockSync._pool.clear()
+
+    def teardown_method(self):
+        """Leave no pooled instances behind for other tests."""
+        RedisMock._pool.clear()
+        RedisMockSync._pool.clear()
+
+    async def test_reset_restores_a_fresh_state(self):
+        """reset() empties every store and restores default settings."""
+        redis = RedisMock()
+        await redis.set("key", "value", ex=60)
+        await redis.hset("hash", "field", "value")
+        await redis.rpush("list", "a")
+        redis.set_delay(0.5)
+        redis.add_error("boom")
+        redis.set_operation_tracking(False)
+
+        redis.reset()
+
+        assert redis.get_stats() == {
+            "keys": 0, "hashes": 0, "lists": 0, "sets": 0,
+            "sorted_sets": 0, "operations": 0, "errors": 0,
+        }
+        assert redis.expirations == {}
+        assert redis.delay == 0.0
+        await redis.get("key")
+        assert redis.get_operation_count() == 1
+
+    async def test_builder_reuses_released_instance(self):
+        """A released mock is handed out again, reset and reconfigured."""
+        redis = RedisMock()
+        await redis.set("stale", "value")
+        redis.release()
+
+        rebuilt = RedisMockBuilder().with_data("fresh", 1).build()
+
+        assert rebuilt is redis
+        assert await rebuilt.get("stale") is None
+        assert await rebuilt.get("fresh") == "1"
+        assert RedisMock._pool == []
+
+    def test_release_is_idempotent(self):
+        """Releasing the same mock twice pools it once."""
+        redis = RedisMock()
+        redis.release()
+        redis.release()
+
+        assert len(RedisMock._pool) == 1
+
+    def test_pools_are_per_class(self):
+        """A released async mock is not handed out for a sync build."""
+        redis = RedisMock()
+        redis.release()
+
+        built = RedisMockBuilder().with_sync().build()
+
+        assert isinstance(built, RedisMockSync)
+        assert RedisMock._pool == [redis]
@@ -0,0 +1,238 @@
+"""
+Unit tests for the trading engine and risk manager mocks.
+"""
+import asyncio
+import functools
+import pytest
+from unittest.mock import AsyncMock
+
+from tests.mocks.trading_mock import RiskManagerMock, TradingMockBuilder, _is_async_callback
+
+
+def _fast_engine():
+    return TradingMockBuilder().with_execution_delay(0.0).with_fill_rate(1.0).build_engine()
+
+
+class TestIsAsyncCallback:
+    """Test cases for how callbacks are classified as sync or async."""
+
+    def test_plain_functions_use_the_coroutine_flag(self):
+        """async def functions are async; def functions and lambdas are not."""
+        async def async_callback(trade):
+            pass
+
+        def sync_callback(trade):
+            pass
+
+        assert _is_async_callback(async_callback)
+        assert not _is_async_callback(sync_callback)
+        assert not _is_async_callback(lambda trade: None)
+
+    def test_callables_without_code_fall_back(self):
+        """Bound methods, partials and AsyncMock are classified correctly."""
+        class Listener:
+            async def on_trade(self, trade):
+                pass
+
+            def on_fill(self, trade):
+                pass
+
+        async def async_callback(trade, extra):
+            pass
+
+        listener = Listener()
+        assert _is_async_callback(listener.on_trade)
+        assert not _is_async_callback(listener.on_fill)
+        assert _is_async_callback(functools.partial(async_callback, extra=1))
+        assert _is_async_callback(AsyncMock())
+        assert not _is_async_callback(print)
+
+
+class TestTradingEngineMock:
+    """Test cases for TradingEngineMock order processing."""
+
+    async def test_raising_fill_callback_does_not_stall_later_orders(self):
+        """A callback that raises while filling one order leaves the worker running."""
+        engine = _fast_engine()
+        calls = []
+
+        def failing_callback(order, trade):
+            calls.append(order.id)
+            if len(calls) == 1:
+                raise RuntimeError("callback failure")
+
+        engine.add_order_callback("order_filled", failing_callback)
+        await engine.start()
+
+        first = await engine.place_order("BTC", 1.0, "buy", price=100.0)
+        await asyncio.sleep(0.01)
+        second = await engine.place_order("BTC", 1.0, "buy", price=100.0)
+        await asyncio.sleep(0.01)
+
+        assert (await engine.get_order(first["id"]))["status"] == "filled"
+        assert (await engine.get_order(second["id"]))["status"] == "filled"
+        assert calls == [first["id"], second["id"]]
+
+        await engine.stop()
+
+    def test_engine_can_be_reused_across_event_loops(self):
+        """Orders placed on a second event loop are still filled."""
+        engine = _fast_engine()
+
+        async def place_and_fill():
+            await engine.start()
+            order = await engine.place_order("BTC", 1.0, "buy", price=100.0)
+            await asyncio.sleep(0.01)
+            return (await engine.get_order(order["id"]))["status"]
+
+        # The first loop closes without stop(), leaving its worker behind
+        assert asyncio.run(place_and_fill()) == "filled"
+        assert asyncio.run(place_and_fill()) == "filled"
+
+    def test_pending_orders_carry_over_to_a_new_loop(self):
+        """Orders left unfilled when a loop closes are filled on the next one."""
+        engine = _fast_engine()
+
+        async def place_unfilled():
+            await engine.start()
+            order = await engine.place_order("BTC", 1.0, "buy", price=100.0)
+            # The worker picks the order up, then waits out this delay until the loop closes
+            engine.execution_delay = 10.0
+            await asyncio.sleep(0)
+            return order["id"]
+
+        async def fill_remaining(order_id):
+            engine.execution_delay = 0.0
+            await engine.start()
+            await asyncio.sleep(0.01)
+            return (await engine.get_order(order_id))["status"]
+
+        order_id = asyncio.run(place_unfilled())
+        assert engine.orders[order_id].status == "pending"
+        assert asyncio.run(fill_remaining(order_id)) == "filled"
+
+    async def test_stop_and_reset_cancel_the_worker(self):
+        """stop() and reset_stats() leave no order worker running."""
+        engine = _fast_engine()
+        await engine.start()
+        worker = engine._order_worker_task
+
+        await engine.stop()
+        assert worker.done()
+        assert engine._order_worker_task is None
+
+        await engine.start()
+        worker = engine._order_worker_task
+        engine.reset_stats()
+        await asyncio.sleep(0)
+        assert worker.cancelled()
+
+    async def test_stop_fills_orders_queued_before_it(self):
+        """Orders queued ahead of stop() are filled before the worker exits."""
+        engine = _fast_engine()
+        await engine.start()
+        order = await engine.place_order("BTC", 1.0, "buy", price=100.0)
+
+        await engine.stop()
+
+        assert (await engine.get_order(order["id"]))["status"] == "filled"
+
+    async def test_failing_async_callbacks_are_reported(self, capsys):
+        """Exceptions from async callbacks are printed rather than dropped."""
+        engine = _fast_engine()
+
+        async def failing_callback(trade):
+            raise RuntimeError(f"failed {trade['order_id']}")
+
+        engine.add_trade_callback(failing_callback)
+        engine.add_trade_callback(failing_callback)
+        await engine.start()
+
+        order = await engine.place_order("BTC", 1.0, "buy", price=100.0)
+        await asyncio.sleep(0.01)
+
+        output = capsys.readouterr().out
+        assert output.count(f"failed {order['id']}") == 2
+        assert not engine._pending_tasks
+
+        await engine.stop()
+
+    async def test_trade_callbacks_receive_each_fill(self):
+        """add_trade_callback registers sync and async callbacks alike."""
+        engine = _fast_engine()
+        sync_trades = []
+        async_trades = []
+
+        async def record_async(trade):
+            async_trades.append(trade["order_id"])
+
+        engine.add_trade_callback(lambda trade: sync_trades.append(trade["order_id"]))
+        engine.add_trade_callback(record_async)
+        await engine.start()
+
+        order = await engine.place_order("BTC", 1.0, "buy", price=100.0)
+        await asyncio.sleep(0.01)
+
+        assert len(engine.trade_callbacks) == 2
+        assert sync_trades == [order["id"]]
+        assert async_trades == [order["id"]]
+
+        await engine.stop()
+
+    async def test_trade_callback_registered_during_dispatch_runs_next_fill(self):
+        """A callback added while a trade is dispatched only sees later trades."""
+        engine = _fast_engine()
+        late_trades = []
+
+        def register_late(trade):
+            if not late_trades and len(engine.trade_callbacks) == 1:
+                engine.add_trade_callback(lambda t: late_trades.append(t["order_id"]))
+
+        engine.add_trade_callback(register_late)
+        await engine.start()
+
+        first = await engine.place_order("BTC", 1.0, "buy", price=100.0)
+        await asyncio.sleep(0.01)
+        second = await engine.place_order("BTC", 1.0, "buy", price=100.0)
+        await asyncio.sleep(0.01)
+
+        assert first["id"] not in late_trades
+        assert late_trades == [second["id"]]
+
+        await engine.stop()
+
+
+class TestRiskManagerMock:
+    """Test cases for RiskManagerMock limits."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.risk_manager = RiskManagerMock()
+
+    async def test_set_max_positions_updates_max_exposure(self):
+        """set_max_positions changes the exposure limit used by check_position_limits."""
+        positions = [
+            {"symbol": "BTC", "quantity": 1.0, "current_price": 900.0},
+            {"symbol": "ETH", "quantity": 1.0, "current_price": 900.0},
+        ]
+
+        result = await self.risk_manager.check_position_limits(positions)
+        assert result["within_limits"]
+        assert result["max_exposure"] == 5000.0
+
+        self.risk_manager.set_max_positions(1)
+        result = await self.risk_manager.check_position_limits(positions)
+        assert not result["within_limits"]
+        assert result["max_exposure"] == 1000.0
+        assert result["violations"] == ["Total exposure $1800.00 exceeds limits"]
+        assert (await self.risk_manager.get_risk_summary())["max_positions"] == 1
+
+    async def test_max_position_size_rescales_max_exposure(self):
+        """Changing the position size keeps the exposure limit in step."""
+        self.risk_manager.set_max_positions(2)
+        self.risk_manager.set_max_position_size(250.0)
+
+        result = await self.risk_manager.check_position_limits([])
+
+        assert result["max_exposure"] == 500.0
+        assert result["within_limits"]
@@ -0,0 +1,95 @@
+"""
+Unit tests for the WebSocket mock.
+"""
+import asyncio
+import json
+
+import pytest
+
+from tests.mocks import websocket_mock
+from tests.mocks.websocket_mock import MockWebSocketMessage, WebSocketMock, WebSocketMockBuilder
+
+
+class TestMockWebSocketMessage:
+    """Test cases for MockWebSocketMessage serialization."""
+
+    def _message(self):
+        return MockWebSocketMessage(
+            data={"symbol": "BTC", "price": 50000.5, "note": "caf\u00e9", "levels": [1, 2]},
+            message_type="json",
+            timestamp=1700000000.25,
+        )
+
+    def test_orjson_output_is_compact(self):
+        """With orjson installed, to_json emits compact JSON with unescaped text."""
+        if websocket_mock.orjson is None:
+            pytest.skip("orjson is not installed")
+
+        assert self._message().to_json() == (
+            '{"data":{"symbol":"BTC","price":50000.5,"note":"caf\u00e9","levels":[1,2]},'
+            '"type":"json","timestamp":1700000000.25}'
+        )
+
+    def test_stdlib_fallback_keeps_json_dumps_output(self, monkeypatch):
+        """Without orjson, to_json returns exactly what json.dumps produces."""
+        monkeypatch.setattr(websocket_mock, "orjson", None)
+        message = self._message()
+
+        assert message.to_json() == json.dumps(message.to_dict())
+
+    def test_unsupported_payload_falls_back(self):
+        """Integers orjson cannot encode still serialize through the stdlib."""
+        message = MockWebSocketMessage(data={"big": 2 ** 70}, timestamp=1.0)
+
+        assert message.to_json() == json.dumps(message.to_dict())
+
+
+class TestWebSocketMockHistory:
+    """Test cases for WebSocketMock message history."""
+
+    async def test_history_limit_keeps_most_recent_messages(self):
+        """Only the newest history_limit sent and received messages are kept."""
+        mock = WebSocketMockBuilder().with_history_limit(3).build()
+        await mock.connect("wss://example.test")
+
+        for i in range(5):
+            await mock.send({"seq": i})
+        mock.queue_messages([{"seq": i} for i in range(5)])
+        await asyncio.sleep(0.01)
+
+        assert mock.history_limit == 3
+        assert [message.data["seq"] for message in mock.get_sent_messages()] == [2, 3, 4]
+        assert [message.data["seq"] for message in mock.get_received_messages()] == [2, 3, 4]
+
+        await mock.disconnect()
+
+    async def test_counters_keep_counting_past_the_limit(self):
+        """messages_sent and messages_received count every message, not just kept ones."""
+        mock = WebSocketMock(history_limit=2)
+        await mock.connect("wss://example.test")
+
+        for i in range(4):
+            await mock.send({"seq": i})
+        mock.queue_messages([{"seq": i} for i in range(4)])
+        await asyncio.sleep(0.01)
+
+        stats = mock.get_stats()
+        assert stats["messages_sent"] == 4
+        assert stats["messages_received"] == 4
+        assert len(mock.get_sent_messages()) == 2
+
+        await mock.disconnect()
+
+    async def test_history_snapshots_are_lists(self):
+        """get_sent_messages returns a list snapshot that later sends do not change."""
+        mock = WebSocketMock()
+        await mock.connect("wss://example.test")
+
+        await mock.send("first")
+        snapshot = mock.get_sent_messages()
+        await mock.send("second")
+
+        assert isinstance(snapshot, list)
+        assert [message.data for message in snapshot] == ["first"]
+
+        await mock.disconnect()